@@ -1,8 +1,15 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import Dict, Optional, List
+from pydantic import BaseModel, Field, PrivateAttr, StringConstraints, TypeAdapter, model_validator
+from typing import Annotated, Any, Dict, Iterator, Mapping, Optional, List, Set, Tuple
+from collections import deque
 import uuid
 from datetime import datetime
-from src.models.workitem import WorkItem, WorkItemStatus, WorkItemType
+from src.models.workitem import WorkItem, WorkItemStatus, WorkItemType, MAX_CHILDREN_COUNT
+from src.models.workitem import TitleStr, DescriptionStr as WorkItemDescriptionStr
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 MIN_NAME_LENGTH = 1
 MAX_NAME_LENGTH = 255
@@ -10,6 +17,18 @@ MIN_DESCRIPTION_LENGTH = 1
 MAX_DESCRIPTION_LENGTH = 2000
 MAX_WORK_ITEMS_COUNT = 5000
 
+NameStr = Annotated[str, StringConstraints(min_length=MIN_NAME_LENGTH, max_length=MAX_NAME_LENGTH)]
+DescriptionStr = Annotated[str, StringConstraints(min_length=MIN_DESCRIPTION_LENGTH, max_length=MAX_DESCRIPTION_LENGTH)]
+
+# fields update_work_item can change on the stored item without copying it
+_INPLACE_FIELDS = frozenset({'status', 'title', 'description'})
+
+# validators for the in-place string fields, which are written without a model validation
+_INPLACE_ADAPTERS = {
+    'title': TypeAdapter(TitleStr),
+    'description': TypeAdapter(WorkItemDescriptionStr),
+}
+
 
 class WorkItemNotFoundError(ValueError):
     """Raised when a work item is not found on the board."""
@@ -25,17 +44,129 @@ class WorkBoard(BaseModel):
     """ Represents a collection of workitems """
     id: uuid.UUID = Field(default_factory=uuid.uuid4, frozen=True)
     created_at: datetime = Field(default_factory=datetime.now, frozen=True)
-    name: str = Field(min_length=MIN_NAME_LENGTH, max_length=MAX_NAME_LENGTH)
-    description: str = Field(min_length=MIN_DESCRIPTION_LENGTH, max_length=MAX_DESCRIPTION_LENGTH)
+    name: NameStr
+    description: DescriptionStr
     work_items: Dict[uuid.UUID, WorkItem] = Field(default_factory=dict, max_length=MAX_WORK_ITEMS_COUNT)
 
+    # secondary indexes of work item ids, dicts are used as insertion-ordered sets
+    _by_type: Dict[WorkItemType, Dict[uuid.UUID, None]] = PrivateAttr(default_factory=dict)
+    _by_status: Dict[WorkItemStatus, Dict[uuid.UUID, None]] = PrivateAttr(default_factory=dict)
+
+    # bumped whenever work items are added, replaced or removed
+    _rev: int = PrivateAttr(default=0)
+    _cached_list: Optional[Tuple[WorkItem, ...]] = PrivateAttr(default=None)
+
     @model_validator(mode='after')
     def validate_work_items_count(self):
         """Validate that the number of work items is less than MAX_WORK_ITEMS_COUNT."""
         if len(self.work_items) > MAX_WORK_ITEMS_COUNT:
             raise ValueError(f"The number of work items must be less than {MAX_WORK_ITEMS_COUNT}")
         return self
+
+    def model_post_init(self, context: Any) -> None:
+        """Build the type and status indexes for the initial work items."""
+        self._reindex()
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> "WorkBoard":
+        """Copy the board, rebuilding its indexes if work_items is replaced."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and 'work_items' in update:
+            copied._reindex()
+        return copied
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "WorkBoard":
+        copied = super().__deepcopy__(memo)
+        # copied work items come out detached, so point them at the new board
+        copied._attach_work_items()
+        return copied
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        super().__setstate__(state)
+        # the listener slot is not pickled, so unpickled work items come out detached too
+        self._attach_work_items()
+
+    # Index maintenance
+    def _reindex(self) -> None:
+        """Rebuild the type and status indexes from work_items"""
+        self._by_type = {}
+        self._by_status = {}
+        self._cached_list = None
+        for work_item in self.work_items.values():
+            self._index_work_item(work_item)
+
+    def _index_work_item(self, work_item: WorkItem) -> None:
+        """Add a work item to the type and status indexes"""
+        self._by_type.setdefault(work_item.work_item_type, {})[work_item.id] = None
+        self._by_status.setdefault(work_item.status, {})[work_item.id] = None
+        self._attach(work_item)
+
+    def _unindex_work_item(self, work_item: WorkItem) -> None:
+        """Remove a work item from the type and status indexes"""
+        self._by_type[work_item.work_item_type].pop(work_item.id, None)
+        self._by_status[work_item.status].pop(work_item.id, None)
+        self._detach(work_item)
+
+    def _attach(self, work_item: WorkItem) -> None:
+        """Have a work item report its status transitions to this board"""
+        # an item can be on several boards, so each board keeps its own listener on it
+        listener = self._on_status_change
+        listeners = getattr(work_item, '_status_listeners', None)
+        if listeners is None:
+            work_item._status_listeners = [listener]
+        elif listener not in listeners:
+            listeners.append(listener)
+
+    def _detach(self, work_item: WorkItem) -> None:
+        """Stop a work item reporting its status transitions to this board"""
+        listeners = getattr(work_item, '_status_listeners', None)
+        if listeners and self._on_status_change in listeners:
+            listeners.remove(self._on_status_change)
+
+    def _attach_work_items(self) -> None:
+        """Have every work item report its status transitions to this board"""
+        for work_item in self.work_items.values():
+            self._attach(work_item)
+
+    def _store_work_item(self, work_item: WorkItem) -> None:
+        """Put a work item on the board and in the indexes, replacing any item with its id"""
+        # a replaced item must leave the indexes and stop reporting its transitions
+        existing = self.work_items.get(work_item.id)
+        if existing is not None:
+            self._unindex_work_item(existing)
+        self.work_items[work_item.id] = work_item
+        self._index_work_item(work_item)
+        self._touch()
+
+    def _touch(self) -> None:
+        """Record a change to the set of work items and drop the cached listing"""
+        self._rev += 1
+        self._cached_list = None
+
+    @property
+    def revision(self) -> int:
+        """A counter that changes whenever work items are added, replaced or removed.
+
+        Edits to the fields of an item already on the board, status changes included, leave it as is.
+        """
+        return self._rev
+
+    def _on_status_change(self, work_item: WorkItem, previous: WorkItemStatus) -> None:
+        """Move a work item to its new status bucket after a transition"""
+        self._by_status[previous].pop(work_item.id, None)
+        self._by_status.setdefault(work_item.status, {})[work_item.id] = None
     
+    # Serialization
+    def dump_json(self) -> bytes:
+        """Serialize the board to JSON, using orjson when it is installed."""
+        if orjson is None:
+            return self.model_dump_json().encode()
+
+        # field values are already JSON-native for orjson, so skip model_dump and
+        # hand it the raw field dicts
+        data = dict(self.__dict__)
+        data['work_items'] = {item_id: item.__dict__ for item_id, item in self.work_items.items()}
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
     # Basic CRUD
     def add_work_item(self, work_item: WorkItem) -> WorkItem:
         """Add a work item to the board."""
@@ -45,35 +176,133 @@ class WorkBoard(BaseModel):
             raise ValueError(f"The number of work items must be less than {MAX_WORK_ITEMS_COUNT}")
 
         # add the work item
-        self.work_items[work_item.id] = work_item
+        self._store_work_item(work_item)
 
-        # link the work item to the parent if present
+        # link the work item to the parent if present, its parent_id is already set
         if work_item.parent_id is not None:
-            self.link_parent_and_child(work_item.parent_id, work_item.id)
+            self.get_work_item(work_item.parent_id).add_child(work_item.id)
 
-        # link the work item to the children if present
-        if work_item.children_ids:
-            for child_id in work_item.children_ids:
-                self.link_parent_and_child(work_item.id, child_id)
+        # link the work item to the children if present, they are already in its children_ids
+        for child_id in work_item.children_ids:
+            self.get_work_item(child_id).add_parent(work_item.id)
         return work_item
 
+    def add_child_of(self, parent_id: uuid.UUID, work_item: WorkItem) -> WorkItem:
+        """Add a work item to the board as a child of a parent already on it."""
+
+        # check that the number of work items does not exceed the maximum allowed
+        if len(self.work_items) >= MAX_WORK_ITEMS_COUNT:
+            raise ValueError(f"The number of work items must be less than {MAX_WORK_ITEMS_COUNT}")
+
+        # resolve the parent and every child before changing anything
+        parent = self.get_work_item(parent_id)
+        children = [self.get_work_item(child_id) for child_id in work_item.children_ids]
+
+        # add_child enforces the children limit, so run it before the item is added
+        parent.add_child(work_item.id)
+        work_item.add_parent(parent_id)
+
+        # add the work item
+        self._store_work_item(work_item)
+
+        # link the work item to the children if present, they are already in its children_ids
+        for child in children:
+            child.add_parent(work_item.id)
+        return work_item
+
+    def add_many(self, items: List[WorkItem]) -> List[WorkItem]:
+        """Add several work items to the board in a single pass, checking them all before adding any."""
+
+        # check that the number of work items does not exceed the maximum allowed
+        work_items = self.work_items
+        if len(work_items) + len(items) > MAX_WORK_ITEMS_COUNT:
+            raise ValueError(f"The number of work items must be less than {MAX_WORK_ITEMS_COUNT}")
+
+        # the items are added with one dict update, so they must be distinct and new to the board
+        batch = {item.id: item for item in items}
+        if len(batch) != len(items):
+            raise ValueError("Work items added together must have distinct ids")
+        existing_ids = work_items.keys() & batch.keys()
+        if existing_ids:
+            raise ValueError(f"Work item {next(iter(existing_ids))} is already on the board")
+
+        # collect every link up front and check all referenced items exist before adding anything
+        links = []
+        for item in items:
+            if item.parent_id is not None:
+                links.append((item.parent_id, item.id))
+            for child_id in item.children_ids:
+                links.append((item.id, child_id))
+        referenced_ids = {linked_id for link in links for linked_id in link}
+        missing_ids = referenced_ids - work_items.keys() - batch.keys()
+        if missing_ids:
+            raise WorkItemNotFoundError(f"Work item {next(iter(missing_ids))} not found on board")
+
+        # check the children limit for every parent, since _link would only fail halfway through
+        new_children: Dict[uuid.UUID, Set[uuid.UUID]] = {}
+        for parent_id, child_id in links:
+            new_children.setdefault(parent_id, set()).add(child_id)
+        for parent_id, child_ids in new_children.items():
+            current_ids = (batch.get(parent_id) or work_items[parent_id]).children_ids
+            if len(current_ids) + len(child_ids.difference(current_ids)) > MAX_CHILDREN_COUNT:
+                raise ValueError(f"The number of children must not exceed {MAX_CHILDREN_COUNT}")
+
+        # add the work items
+        work_items.update(batch)
+        for item in items:
+            self._index_work_item(item)
+        self._touch()
+
+        # link parents and children
+        for parent_id, child_id in links:
+            self._link(work_items[parent_id], work_items[child_id])
+        return items
+
     def find_work_item(self, id: uuid.UUID) -> Optional[WorkItem]:
         """ Return the work item if it exists, otherwise return None """
         return self.work_items.get(id)
 
-    def get_work_item(self, id: uuid.UUID) -> Optional[WorkItem]:
+    def get_work_item(self, id: uuid.UUID) -> WorkItem:
         """ Return the work item if it exists, otherwise raise an error """
-        item = self.find_work_item(id)
-        if item is None:
-            raise WorkItemNotFoundError(f"Work item {id} not found on board")
-        return item
+        try:
+            return self.work_items[id]
+        except KeyError:
+            raise WorkItemNotFoundError(f"Work item {id} not found on board") from None
     
     def update_work_item(self, id: uuid.UUID, **updates) -> WorkItem:
         item = self.get_work_item(id)
+
+        # updates are not validated, so coerce the status to its enum member
+        if 'status' in updates:
+            updates['status'] = WorkItemStatus(updates['status'])
+
+        # scalar fields are written in place instead of copying the whole item
+        if updates.keys() <= _INPLACE_FIELDS:
+            status = updates.pop('status', None)
+            # check every value against the field constraints before writing any of them
+            values = {field: _INPLACE_ADAPTERS[field].validate_python(value) for field, value in updates.items()}
+            for field, value in values.items():
+                item._write_field(field, value)
+            if status is not None:
+                item._set_status(status)
+            return item
+
         updated_item = item.model_copy(update=updates)
         self.work_items[id] = updated_item
+        self._touch()
+
+        # model_copy skips the frozen check, so the copy may have a new type as well as
+        # a new status, reindex it in both
+        self._unindex_work_item(item)
+        self._index_work_item(updated_item)
         return updated_item
 
+    def update_status(self, id: uuid.UUID, status: WorkItemStatus) -> WorkItem:
+        """Change the status of a work item, keeping the status index in sync"""
+        item = self.get_work_item(id)
+        item._set_status(WorkItemStatus(status))
+        return item
+
     def delete_work_item(self, id: uuid.UUID) -> None:
         """ Delete a work item from the board and all references to it"""
         item = self.get_work_item(id)
@@ -83,45 +312,99 @@ class WorkBoard(BaseModel):
             self.unlink_parent_and_child(item.parent_id, id)
 
         # Remove references to this item from its children
-        # Make a copy of the list to avoid modification during iteration
-        if item.children_ids:
-            children_ids_copy = list(item.children_ids)
-            for child_id in children_ids_copy:
-                self.unlink_parent_and_child(id, child_id)
+        # Unlink from the tail so each removal is a pop without copying the list
+        children_ids = item.children_ids
+        while children_ids:
+            self.unlink_parent_and_child(id, children_ids[-1])
+        self._unindex_work_item(item)
         del self.work_items[id]
+        self._touch()
     
     # Query methods
-    def list_work_items(self) -> List[WorkItem]:
-        return list(self.work_items.values())
+    def list_work_items(self) -> Tuple[WorkItem, ...]:
+        """ Return all work items, reusing the previous result until the board changes """
+        cached = self._cached_list
+        # the length check also catches items added or removed through work_items directly,
+        # but an item replaced there under an existing key is not seen until the board changes
+        if cached is None or len(cached) != len(self.work_items):
+            cached = self._cached_list = tuple(self.work_items.values())
+        return cached
 
     def list_by_type(self, work_item_type: WorkItemType) -> List[WorkItem]:
-        return [item for item in self.work_items.values() if item.work_item_type == work_item_type]
+        work_items = self.work_items
+        return [work_items[i] for i in self._by_type.get(work_item_type, ())]
 
     def list_by_status(self, status: WorkItemStatus) -> List[WorkItem]:
-        return [item for item in self.work_items.values() if item.status == status]
+        work_items = self.work_items
+        return [work_items[i] for i in self._by_status.get(status, ())]
     
     # Relationship methods
     def link_parent_and_child(self, parent_id: uuid.UUID, child_id: uuid.UUID) -> None:
         """ Link two work items together as parent and child """
 
+        parent, child = self._require_pair(parent_id, child_id)
+
+        self._link(parent, child)
+
+    def link_children(self, parent_id: uuid.UUID, child_ids: List[uuid.UUID]) -> None:
+        """ Link several children to a parent, checking the children limit once """
+
+        # resolve every work item before linking any of them
         parent = self.get_work_item(parent_id)
-        child = self.get_work_item(child_id)
-        child.add_parent(parent_id)
-        parent.add_child(child_id)
+        children = [self.get_work_item(child_id) for child_id in child_ids]
+
+        parent.add_children(child_ids)
+        for child in children:
+            child.add_parent(parent_id)
+
+    def _require_pair(self, parent_id: uuid.UUID, child_id: uuid.UUID) -> Tuple[WorkItem, WorkItem]:
+        """ Return the parent and child work items, raising if either is not on the board """
+        work_items = self.work_items
+        try:
+            return work_items[parent_id], work_items[child_id]
+        except KeyError as error:
+            raise WorkItemNotFoundError(f"Work item {error.args[0]} not found on board") from None
+
+    def _link(self, parent: WorkItem, child: WorkItem) -> None:
+        """ Link two work items that are known to be on the board """
+        # add_child enforces the children limit, so run it before touching the child
+        parent.add_child(child.id)
+        child.add_parent(parent.id)
 
 
     def unlink_parent_and_child(self, parent_id: uuid.UUID, child_id: uuid.UUID) -> None:
         """ Remove the link between a parent and a child """
-        parent = self.get_work_item(parent_id)
-        child = self.get_work_item(child_id)
+        parent, child = self._require_pair(parent_id, child_id)
         parent.remove_child(child_id)
         child.remove_parent()
         
     def get_children(self, parent_id: uuid.UUID) -> List[WorkItem]:
         """ Return all the children of a parent """
-        parent = self.get_work_item(parent_id)
-        return [self.get_work_item(child_id) for child_id in parent.children_ids]
+        # index the dict directly and only convert the error if a child id is dangling
+        work_items = self.work_items
+        children_ids = self.get_work_item(parent_id).children_ids
+        try:
+            return [work_items[child_id] for child_id in children_ids]
+        except KeyError as error:
+            raise WorkItemNotFoundError(f"Work item {error.args[0]} not found on board") from None
     
+    def iter_descendants(self, root_id: uuid.UUID) -> Iterator[WorkItem]:
+        """ Yield every descendant of a work item, breadth first, each at most once """
+        work_items = self.work_items
+        queue = deque(self.get_work_item(root_id).children_ids)
+        seen = {root_id}
+        while queue:
+            current_id = queue.popleft()
+            if current_id in seen:
+                continue
+            seen.add(current_id)
+            try:
+                current = work_items[current_id]
+            except KeyError:
+                raise WorkItemNotFoundError(f"Work item {current_id} not found on board") from None
+            yield current
+            queue.extend(current.children_ids)
+
     def get_parent(self, child_id: uuid.UUID) -> Optional[WorkItem]:
         """ Return the parent of a child, if it exists, otherwise return None """
         child = self.get_work_item(child_id)
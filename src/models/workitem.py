@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, model_validator
-from typing import Optional, List
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, model_validator
+from typing import Annotated, Any, Iterable, Mapping, Optional, List
 from enum import Enum
 import uuid
 from datetime import datetime
@@ -10,6 +10,9 @@ MIN_DESCRIPTION_LENGTH = 1
 MAX_DESCRIPTION_LENGTH = 2000
 MAX_CHILDREN_COUNT = 100
 
+TitleStr = Annotated[str, StringConstraints(min_length=MIN_TITLE_LENGTH, max_length=MAX_TITLE_LENGTH)]
+DescriptionStr = Annotated[str, StringConstraints(min_length=MIN_DESCRIPTION_LENGTH, max_length=MAX_DESCRIPTION_LENGTH)]
+
 class WorkItemStatus(str, Enum):
     TO_DO = "to_do"
     IN_PROGRESS = "in_progress"
@@ -21,30 +24,137 @@ class WorkItemType(str, Enum):
     FEATURE = "feature"
     EPIC = "epic"
 
+# type labels resolved once for __str__ and __repr__, skipping the enum value property
+_TYPE_STR = {t: t.value for t in WorkItemType}
+
+# status members resolved once for the transition methods
+_S_TODO = WorkItemStatus.TO_DO
+_S_IP = WorkItemStatus.IN_PROGRESS
+_S_DONE = WorkItemStatus.DONE
+
+
+class ChildIdList(list):
+    """A list of child ids that mirrors its members in a set for O(1) membership checks."""
+    __slots__ = ('_members',)
+
+    def __init__(self, ids: Iterable[uuid.UUID] = ()):
+        super().__init__(ids)
+        self._members = set(self)
+
+    def __reduce__(self):
+        return (type(self), (list(self),))
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._members
+
+    def has_duplicates(self) -> bool:
+        """Return True if any id appears more than once."""
+        return len(self._members) != len(self)
+
+    def _discard(self, item: uuid.UUID) -> None:
+        # the set only tracks distinct ids, so keep it if a duplicate is still in the list
+        if len(self._members) > len(self) or not list.__contains__(self, item):
+            self._members.discard(item)
+
+    def append(self, item: uuid.UUID) -> None:
+        super().append(item)
+        self._members.add(item)
+
+    def extend(self, items: Iterable[uuid.UUID]) -> None:
+        items = list(items)
+        super().extend(items)
+        self._members.update(items)
+
+    def __iadd__(self, items: Iterable[uuid.UUID]) -> "ChildIdList":
+        self.extend(items)
+        return self
+
+    def insert(self, index: int, item: uuid.UUID) -> None:
+        super().insert(index, item)
+        self._members.add(item)
+
+    def remove(self, item: uuid.UUID) -> None:
+        super().remove(item)
+        self._discard(item)
+
+    def pop(self, index: int = -1) -> uuid.UUID:
+        item = super().pop(index)
+        self._discard(item)
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._members.clear()
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        super().__setitem__(index, value)
+        self._members = set(self)
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        self._members = set(self)
+
+    def __imul__(self, n: int) -> "ChildIdList":
+        super().__imul__(n)
+        if n <= 0:
+            self._members.clear()
+        return self
+
 class WorkItem(BaseModel):
+    # state transitions write fields directly, so assignments are never revalidated
+    model_config = ConfigDict(validate_assignment=False)
+
+    # called with (item, previous_status) when a transition changes the status, one per
+    # board holding the item; kept in a slot so copies of the item start out detached
+    __slots__ = ('_status_listeners',)
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, frozen=True)
     work_item_type: WorkItemType = Field(frozen=True)
     created_at: datetime = Field(default_factory=datetime.now, frozen=True)
     parent_id: Optional[uuid.UUID] = Field(default=None)
     children_ids: List[uuid.UUID] = Field(default_factory=list, max_length=MAX_CHILDREN_COUNT)
     status: WorkItemStatus = Field(default=WorkItemStatus.TO_DO)
-    title: str = Field(min_length=MIN_TITLE_LENGTH, max_length=MAX_TITLE_LENGTH)
-    description: str = Field(min_length=MIN_DESCRIPTION_LENGTH, max_length=MAX_DESCRIPTION_LENGTH)
+    title: TitleStr
+    description: DescriptionStr
+
+    def model_post_init(self, context: Any) -> None:
+        """Back children_ids with a ChildIdList."""
+        if type(self.children_ids) is not ChildIdList:
+            self.__dict__['children_ids'] = ChildIdList(self.children_ids)
 
     @model_validator(mode='after')
     def validate_children_ids_uniqueness(self):
         """Validate that children_ids contains only unique UUIDs."""
-        if len(self.children_ids) != len(set(self.children_ids)):
+        # model_post_init has already built the ChildIdList, so its set gives the answer
+        if self.children_ids.has_duplicates():
             raise ValueError("children_ids must contain unique UUIDs")
         return self
 
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> "WorkItem":
+        """Copy the work item, rebuilding the children index only if children_ids is replaced."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update and 'children_ids' in update:
+            copied.__dict__['children_ids'] = ChildIdList(copied.children_ids)
+        return copied
+
+    def revalidate(self) -> None:
+        """Check the current field values, raising ValidationError if they are no longer valid"""
+        # validate the raw field dict directly instead of a model_dump round trip,
+        # the validated copy is discarded so the item itself is left unchanged
+        type(self).model_validate(self.__dict__)
+
+    def _write_field(self, name: str, value: Any) -> None:
+        """Write a field without validation, marking it as set the way an assignment does"""
+        self.__dict__[name] = value
+        self.__pydantic_fields_set__.add(name)
+
     def add_parent(self, parent_id: uuid.UUID) -> None:
         """Add a parent to the work item"""
-        self.parent_id = parent_id
+        self._write_field('parent_id', parent_id)
 
     def remove_parent(self) -> None:
         """Remove the parent from the work item"""
-        self.parent_id = None
+        self._write_field('parent_id', None)
 
     def add_child(self, child_id: uuid.UUID) -> None:
         """Add a child to the work item"""
@@ -59,6 +169,31 @@ class WorkItem(BaseModel):
 
         self.children_ids.append(child_id)
 
+    def add_children(self, child_ids: Iterable[uuid.UUID]) -> None:
+        """Add several children to the work item, checking the limit once"""
+
+        # skip children that are already added, including repeats in child_ids
+        children_ids = self.children_ids
+        new_ids = [child_id for child_id in dict.fromkeys(child_ids) if child_id not in children_ids]
+
+        # check that the number of children stays within the maximum allowed
+        if len(children_ids) + len(new_ids) > MAX_CHILDREN_COUNT:
+            raise ValueError(f"The number of children must not exceed {MAX_CHILDREN_COUNT}")
+
+        children_ids.extend(new_ids)
+
+    def set_children(self, child_ids: Iterable[uuid.UUID]) -> None:
+        """Replace the children of the work item in one pass"""
+
+        # build the replacement up front so the current children survive a rejected call
+        new_ids = ChildIdList(child_ids)
+        if new_ids.has_duplicates():
+            raise ValueError("children_ids must contain unique UUIDs")
+        if len(new_ids) > MAX_CHILDREN_COUNT:
+            raise ValueError(f"The number of children must not exceed {MAX_CHILDREN_COUNT}")
+
+        self._write_field('children_ids', new_ids)
+
     def remove_child(self, child_id: uuid.UUID) -> None:
         """Remove a child from the work item"""
 
@@ -66,19 +201,42 @@ class WorkItem(BaseModel):
         if child_id not in self.children_ids:
             raise ValueError(f"Child work item {child_id} is not a child of this work item")
 
-        self.children_ids.remove(child_id)
+        # popping the tail avoids the linear scan of list.remove
+        if self.children_ids[-1] == child_id:
+            self.children_ids.pop()
+        else:
+            self.children_ids.remove(child_id)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # status assignments go through _set_status so the listeners see them too,
+        # and assigned children_ids are wrapped to keep the ChildIdList index
+        if name == 'status':
+            self._set_status(value)
+        elif name == 'children_ids':
+            super().__setattr__(name, ChildIdList(value))
+        else:
+            super().__setattr__(name, value)
+
+    def _set_status(self, status: WorkItemStatus) -> None:
+        """Write the status and notify the listeners if it changed"""
+        previous = self.status
+        self._write_field('status', status)
+        listeners = getattr(self, '_status_listeners', None)
+        if listeners and previous is not status:
+            for listener in listeners:
+                listener(self, previous)
 
     def start(self) -> None:
-        self.status = WorkItemStatus.IN_PROGRESS
+        self._set_status(_S_IP)
 
     def complete(self) -> None:
-        self.status = WorkItemStatus.DONE 
+        self._set_status(_S_DONE)
     
     def reset(self) -> None:
-        self.status = WorkItemStatus.TO_DO
+        self._set_status(_S_TODO)
 
     def __str__(self) -> str:
-        return f"{self.work_item_type.value} {self.title}"
+        return f"{_TYPE_STR[self.work_item_type]} {self.title}"
 
     def __repr__(self) -> str:
-        return f"<WorkItem {self.id} {self.work_item_type.value} {self.title}>"
\ No newline at end of file
+        return f"<WorkItem {self.id} {_TYPE_STR[self.work_item_type]} {self.title}>"
\ No newline at end of file
@@ -1,5 +1,9 @@
+import itertools
+import json
+import pickle
+import re
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 import pytest
 from pydantic import ValidationError
 
@@ -7,16 +11,61 @@ from src.models.workboard import (
     WorkBoard,
     WorkItemNotFoundError,
     WorkItemRelationshipError,
-    MAX_WORK_ITEMS_COUNT,
     MAX_NAME_LENGTH,
     MAX_DESCRIPTION_LENGTH,
 )
 from src.models.workitem import WorkItem, WorkItemStatus, WorkItemType, MAX_CHILDREN_COUNT
 
 
+# Enum members used throughout the tests, resolved once
+TASK = WorkItemType.TASK
+STORY = WorkItemType.STORY
+FEATURE = WorkItemType.FEATURE
+EPIC = WorkItemType.EPIC
+TODO = WorkItemStatus.TO_DO
+IN_PROGRESS = WorkItemStatus.IN_PROGRESS
+DONE = WorkItemStatus.DONE
+
+
+# Error message patterns shared by the pytest.raises checks
+_MAX_ITEMS_RE = re.compile("must be less than")
+_MAX_CHILDREN_RE = re.compile(f"must not exceed {MAX_CHILDREN_COUNT}")
+
+
+# Fixed value for the frozen created_at check, which only needs some datetime
+_SAMPLE_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+# Validated once and copied by create_sample_board, copies keep its created_at
+_TEMPLATE_BOARD = WorkBoard(name="Test Board", description="Test description")
+
+
+# Shared by every pool so ids never repeat within a test run
+_next_id = itertools.count(1).__next__
+
+
+# The counter starts at 1, so this id is never handed out by the pool
+_MISSING_ID = uuid.UUID(int=0)
+
+
+def _new_id() -> uuid.UUID:
+    """Return a UUID built from the module-wide integer counter."""
+    return uuid.UUID(int=_next_id())
+
+
+def _uuid_pool(n: int) -> list:
+    """Return n distinct UUIDs built from a module-wide integer counter."""
+    return [uuid.UUID(int=_next_id()) for _ in range(n)]
+
+
 def create_sample_board(**overrides) -> WorkBoard:
     """Helper function to create a sample WorkBoard."""
+    if not overrides:
+        return _TEMPLATE_BOARD.model_copy(
+            update={"id": _new_id(), "work_items": {}}
+        )
     data = {
+        "id": _new_id(),
         "name": "Test Board",
         "description": "Test description",
     }
@@ -24,15 +73,67 @@ def create_sample_board(**overrides) -> WorkBoard:
     return WorkBoard(**data)
 
 
+_ITEM_DEFAULTS = {
+    "work_item_type": TASK,
+    "title": "Test title",
+    "description": "Test description",
+}
+
+
 def create_sample_work_item(**overrides) -> WorkItem:
     """Helper function to create a sample WorkItem."""
-    data = {
-        "work_item_type": WorkItemType.TASK,
-        "title": "Test title",
-        "description": "Test description",
-    }
-    data.update(overrides)
-    return WorkItem(**data)
+    return WorkItem.model_validate({"id": _new_id(), **_ITEM_DEFAULTS, **overrides})
+
+
+# Validated once and copied by the children limit tests, the ids are kept alongside
+_CHILD_IDS = _uuid_pool(MAX_CHILDREN_COUNT + 1)
+_CHILD_TEMPLATES = [
+    WorkItem(
+        id=child_id,
+        work_item_type=TASK,
+        title=f"Child {i}",
+        description=f"Child {i} description",
+    )
+    for i, child_id in enumerate(_CHILD_IDS)
+]
+
+
+def _copy_child_templates(count: int) -> list:
+    """Return fresh copies of the first count child templates."""
+    return [template.model_copy(update={"children_ids": []}) for template in _CHILD_TEMPLATES[:count]]
+
+
+@pytest.fixture(scope="module")
+def empty_board() -> WorkBoard:
+    """Board shared by read-only tests that need no work items."""
+    return create_sample_board()
+
+
+@pytest.fixture
+def board_with_task():
+    """Fresh board holding a single to-do task, for tests that change it."""
+    board = create_sample_board()
+    task = create_sample_work_item(
+        work_item_type=TASK,
+        title="Old Title",
+        description="Old description",
+        status=TODO
+    )
+    board.add_work_item(task)
+    return board, task
+
+
+@pytest.fixture(scope="module")
+def ro_board_with_task():
+    """Board holding a single task, shared by read-only tests."""
+    board = create_sample_board()
+    task = create_sample_work_item(
+        work_item_type=TASK,
+        title="Test Task",
+        description="Test"
+    )
+    board.add_work_item(task)
+    return board, task
 
 
 # ==================== Board Creation Tests ====================
@@ -40,7 +141,10 @@ def create_sample_work_item(**overrides) -> WorkItem:
 class TestWorkBoardCreation:
     def test_board_creation_defaults(self):
         """Test that a WorkBoard is created with default values."""
-        board = create_sample_board()
+        # Build through the constructor so the created_at default factory runs
+        before = datetime.now()
+        board = WorkBoard(name="Test Board", description="Test description")
+        after = datetime.now()
         
         assert isinstance(board.id, uuid.UUID)
         assert board.name == "Test Board"
@@ -48,9 +152,8 @@ class TestWorkBoardCreation:
         assert board.work_items == {}
         assert isinstance(board.created_at, datetime)
         
-        # created_at should be close to "now"
-        now = datetime.now()
-        assert now - timedelta(seconds=5) <= board.created_at <= now + timedelta(seconds=5)
+        # created_at is stamped while the board is being created
+        assert before <= board.created_at <= after
 
     def test_board_creation_with_custom_values(self):
         """Test creating a board with custom values."""
@@ -63,6 +166,18 @@ class TestWorkBoardCreation:
         assert board.description == "A board for managing project tasks"
         assert len(board.work_items) == 0
 
+    def test_sample_boards_are_independent(self):
+        """Test that boards copied from the same template do not share state."""
+        board = create_sample_board()
+        other = create_sample_board()
+        
+        board.add_work_item(create_sample_work_item())
+        
+        assert board.id != other.id
+        assert other.work_items == {}
+        assert other.list_by_type(TASK) == []
+        assert other.list_work_items() == ()
+
     def test_board_name_validation(self):
         """Test that board name validation works."""
         # Too short
@@ -88,49 +203,43 @@ class TestWorkBoardCreation:
         board = create_sample_board()
         
         with pytest.raises(ValidationError):
-            board.id = uuid.uuid4()
+            board.id = _new_id()
         
         with pytest.raises(ValidationError):
-            board.created_at = datetime.now()
+            board.created_at = _SAMPLE_NOW
 
 
 # ==================== Work Item CRUD Tests ====================
 
 class TestWorkItemCRUD:
-    def test_add_work_item(self):
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            {
+                "work_item_type": TASK,
+                "title": "Test Task",
+                "description": "Test description",
+            },
+            {
+                "work_item_type": FEATURE,
+                "title": "New Feature",
+                "description": "Feature description",
+                "status": IN_PROGRESS,
+            },
+        ],
+        ids=["defaults", "all_fields"],
+    )
+    def test_add_work_item(self, fields):
         """Test adding a work item to the board."""
         board = create_sample_board()
         
-        item = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Test Task",
-            description="Test description"
-        )
-        added_item = board.add_work_item(item)
-        
-        assert item.id in board.work_items
-        assert added_item.title == "Test Task"
-        assert added_item.description == "Test description"
-        assert added_item.work_item_type == WorkItemType.TASK
-        assert added_item.status == WorkItemStatus.TO_DO
-        assert board.work_items[item.id] == item
-
-    def test_add_work_item_with_all_fields(self):
-        """Test adding a work item with all fields specified."""
-        board = create_sample_board()
-        
-        item = create_sample_work_item(
-            work_item_type=WorkItemType.FEATURE,
-            title="New Feature",
-            description="Feature description",
-            status=WorkItemStatus.IN_PROGRESS
-        )
+        item = create_sample_work_item(**fields)
         added_item = board.add_work_item(item)
         
-        assert added_item.work_item_type == WorkItemType.FEATURE
-        assert added_item.status == WorkItemStatus.IN_PROGRESS
-        assert added_item.title == "New Feature"
-        assert added_item.description == "Feature description"
+        assert board.work_items.get(item.id) is item
+        assert added_item.status == fields.get("status", TODO)
+        for field, value in fields.items():
+            assert getattr(added_item, field) == value
 
     def test_add_work_item_with_parent(self):
         """Test adding a work item with a parent."""
@@ -138,7 +247,7 @@ class TestWorkItemCRUD:
         
         # Create and add parent
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.EPIC,
+            work_item_type=EPIC,
             title="Parent Epic",
             description="Parent description"
         )
@@ -146,7 +255,7 @@ class TestWorkItemCRUD:
         
         # Create and add child with parent_id
         child = create_sample_work_item(
-            work_item_type=WorkItemType.FEATURE,
+            work_item_type=FEATURE,
             title="Child Feature",
             description="Child description",
             parent_id=parent.id
@@ -162,14 +271,14 @@ class TestWorkItemCRUD:
         
         # Create and add children first
         child1 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child 1",
             description="Child 1 description"
         )
         board.add_work_item(child1)
         
         child2 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child 2",
             description="Child 2 description"
         )
@@ -177,7 +286,7 @@ class TestWorkItemCRUD:
         
         # Create and add parent with children
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent Story",
             description="Parent description",
             children_ids=[child1.id, child2.id]
@@ -190,132 +299,278 @@ class TestWorkItemCRUD:
         assert child1.parent_id == parent.id
         assert child2.parent_id == parent.id
 
-    def test_find_work_item_exists(self):
-        """Test finding a work item that exists."""
+    def test_add_child_of(self):
+        """Test adding a work item directly under a parent on the board."""
         board = create_sample_board()
-        item = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Test Task",
-            description="Test"
+        
+        parent = create_sample_work_item(
+            work_item_type=STORY,
+            title="Parent Story",
+            description="Parent"
         )
-        board.add_work_item(item)
+        board.add_work_item(parent)
         
-        found = board.find_work_item(item.id)
-        assert found is not None
-        assert found.id == item.id
-        assert found.title == "Test Task"
-
-    def test_find_work_item_not_exists(self):
-        """Test finding a work item that doesn't exist."""
-        board = create_sample_board()
-        non_existent_id = uuid.uuid4()
+        child = create_sample_work_item(
+            work_item_type=TASK,
+            title="Child Task",
+            description="Child"
+        )
+        added = board.add_child_of(parent.id, child)
         
-        found = board.find_work_item(non_existent_id)
-        assert found is None
+        assert added is child
+        assert board.work_items[child.id] is child
+        assert child.parent_id == parent.id
+        assert parent.children_ids == [child.id]
+        assert board.list_by_type(TASK) == [child]
 
-    def test_get_work_item_exists(self):
-        """Test getting a work item that exists."""
+    def test_add_child_of_respects_children_limit(self):
+        """Test that add_child_of leaves the board unchanged when the parent is full."""
         board = create_sample_board()
-        item = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Test Task",
-            description="Test"
+        
+        parent = create_sample_work_item(
+            work_item_type=STORY,
+            title="Parent",
+            description="Parent",
+            children_ids=_CHILD_IDS[:MAX_CHILDREN_COUNT]
         )
-        board.add_work_item(item)
+        board.add_many([*_copy_child_templates(MAX_CHILDREN_COUNT), parent])
         
-        found = board.get_work_item(item.id)
-        assert found.id == item.id
-        assert found.title == "Test Task"
+        extra_child = create_sample_work_item(
+            work_item_type=TASK,
+            title="Extra Child",
+            description="This should fail"
+        )
+        with pytest.raises(ValueError, match=_MAX_CHILDREN_RE):
+            board.add_child_of(parent.id, extra_child)
+        
+        assert extra_child.id not in board.work_items
+        assert extra_child.parent_id is None
+        assert len(parent.children_ids) == MAX_CHILDREN_COUNT
 
-    def test_get_work_item_not_exists(self):
-        """Test getting a work item that doesn't exist raises exception."""
+    def test_add_child_of_parent_not_exists(self):
+        """Test that add_child_of raises when the parent is not on the board."""
         board = create_sample_board()
-        non_existent_id = uuid.uuid4()
+        child = create_sample_work_item()
         
-        with pytest.raises(WorkItemNotFoundError, match="not found on board"):
-            board.get_work_item(non_existent_id)
+        with pytest.raises(WorkItemNotFoundError):
+            board.add_child_of(_MISSING_ID, child)
+        assert board.work_items == {}
+
+    def test_add_child_of_child_not_exists(self, board_with_task):
+        """Test that add_child_of leaves the board unchanged when a listed child is missing."""
+        board, parent = board_with_task
+        
+        item = create_sample_work_item(children_ids=[_MISSING_ID])
+        
+        with pytest.raises(WorkItemNotFoundError):
+            board.add_child_of(parent.id, item)
+        assert item.id not in board.work_items
+        assert item.parent_id is None
+        assert parent.children_ids == []
 
-    def test_update_work_item_title(self):
-        """Test updating a work item's title."""
+    def test_add_many(self):
+        """Test adding several work items at once links their relationships."""
         board = create_sample_board()
-        item = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Old Title",
-            description="Test"
+        
+        existing = create_sample_work_item(
+            work_item_type=TASK,
+            title="Existing Task",
+            description="Existing"
         )
-        board.add_work_item(item)
+        board.add_work_item(existing)
+        
+        parent = create_sample_work_item(
+            work_item_type=STORY,
+            title="Parent Story",
+            description="Parent",
+            children_ids=[existing.id]
+        )
+        child = create_sample_work_item(
+            work_item_type=TASK,
+            title="New Task",
+            description="New",
+            parent_id=parent.id
+        )
+        added = board.add_many([parent, child])
         
-        updated = board.update_work_item(item.id, title="New Title")
-        assert updated.title == "New Title"
-        assert board.work_items[item.id].title == "New Title"
+        assert added == [parent, child]
+        assert len(board.work_items) == 3
+        assert parent.children_ids == [existing.id, child.id]
+        assert existing.parent_id == parent.id
+        assert child.parent_id == parent.id
+        assert board.list_by_type(TASK) == [existing, child]
 
-    def test_update_work_item_description(self):
-        """Test updating a work item's description."""
+    def test_add_many_missing_reference(self):
+        """Test that add_many rejects items referencing unknown work items without adding any."""
         board = create_sample_board()
+        
         item = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Test",
-            description="Old description"
+            work_item_type=TASK,
+            title="Orphan",
+            description="Orphan",
+            parent_id=_MISSING_ID
         )
-        board.add_work_item(item)
         
-        updated = board.update_work_item(item.id, description="New description")
-        assert updated.description == "New description"
+        with pytest.raises(WorkItemNotFoundError):
+            board.add_many([item])
+        assert board.work_items == {}
 
-    def test_update_work_item_status(self):
-        """Test updating a work item's status."""
+    def test_add_many_respects_max_work_items(self, monkeypatch):
+        """Test that add_many checks the board capacity before adding."""
+        monkeypatch.setattr("src.models.workboard.MAX_WORK_ITEMS_COUNT", 1)
         board = create_sample_board()
-        item = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Test",
-            description="Test"
-        )
-        board.add_work_item(item)
         
-        assert item.status == WorkItemStatus.TO_DO
-        updated = board.update_work_item(item.id, status=WorkItemStatus.IN_PROGRESS)
-        assert updated.status == WorkItemStatus.IN_PROGRESS
+        items = [create_sample_work_item(), create_sample_work_item()]
+        
+        with pytest.raises(ValueError, match=_MAX_ITEMS_RE):
+            board.add_many(items)
+        assert board.work_items == {}
 
-    def test_update_work_item_multiple_fields(self):
-        """Test updating multiple fields at once."""
+    def test_add_many_rejects_repeated_ids(self):
+        """Test that add_many rejects a batch holding the same id twice without adding any."""
+        board = create_sample_board()
+        
+        item = create_sample_work_item()
+        
+        with pytest.raises(ValueError, match="distinct ids"):
+            board.add_many([item, item])
+        assert board.work_items == {}
+
+    def test_add_many_respects_children_limit(self):
+        """Test that add_many checks every parent's children limit before adding anything."""
         board = create_sample_board()
-        item = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Old Title",
-            description="Old description",
-            status=WorkItemStatus.TO_DO
-        )
-        board.add_work_item(item)
         
-        updated = board.update_work_item(
-            item.id,
-            title="New Title",
-            description="New description",
-            status=WorkItemStatus.DONE
+        parent = create_sample_work_item(
+            work_item_type=STORY,
+            title="Parent",
+            description="Parent",
+            children_ids=_CHILD_IDS[:MAX_CHILDREN_COUNT - 1]
         )
+        board.add_many([*_copy_child_templates(MAX_CHILDREN_COUNT - 1), parent])
+        
+        new_children = [create_sample_work_item(parent_id=parent.id) for _ in range(2)]
         
-        assert updated.title == "New Title"
-        assert updated.description == "New description"
-        assert updated.status == WorkItemStatus.DONE
+        with pytest.raises(ValueError, match=_MAX_CHILDREN_RE):
+            board.add_many(new_children)
+        assert len(board.work_items) == MAX_CHILDREN_COUNT
+        assert len(parent.children_ids) == MAX_CHILDREN_COUNT - 1
 
-    def test_update_work_item_not_exists(self):
-        """Test updating a work item that doesn't exist raises exception."""
+    def test_add_many_rejects_items_already_on_board(self, board_with_task):
+        """Test that add_many rejects an item whose id is already on the board without adding any."""
+        board, task = board_with_task
+        
+        new_item = create_sample_work_item()
+        replacement = create_sample_work_item(id=task.id, status=DONE)
+        
+        with pytest.raises(ValueError, match="already on the board"):
+            board.add_many([new_item, replacement])
+        assert board.work_items == {task.id: task}
+        assert board.list_by_status(TODO) == [task]
+
+    def test_add_work_item_replaces_item_with_same_id(self, board_with_task):
+        """Test that re-adding an id moves the indexes to the new item and detaches the old one."""
+        board, task = board_with_task
+        
+        replacement = create_sample_work_item(id=task.id, work_item_type=STORY, status=DONE)
+        board.add_work_item(replacement)
+        
+        assert board.work_items[task.id] is replacement
+        assert board.list_by_type(TASK) == []
+        assert board.list_by_type(STORY) == [replacement]
+        assert board.list_by_status(TODO) == []
+        assert board.list_by_status(DONE) == [replacement]
+        
+        # the replaced item no longer drives the board's status index
+        task.start()
+        assert board.list_by_status(IN_PROGRESS) == []
+        assert board.list_by_status(DONE) == [replacement]
+
+    @pytest.mark.parametrize("method", ["find_work_item", "get_work_item"])
+    def test_find_and_get_work_item_exists(self, method, ro_board_with_task):
+        """Test finding and getting a work item that exists."""
+        board, item = ro_board_with_task
+        found = getattr(board, method)(item.id)
+        assert found is not None
+        assert found.id == item.id
+        assert found.title == "Test Task"
+
+    def test_find_work_item_not_exists(self, empty_board):
+        """Test finding a work item that doesn't exist."""
+        assert empty_board.find_work_item(_MISSING_ID) is None
+
+    @pytest.mark.parametrize(
+        "method, kwargs",
+        [
+            ("get_work_item", {}),
+            ("update_work_item", {"title": "New Title"}),
+            ("delete_work_item", {}),
+            ("get_children", {}),
+            ("get_parent", {}),
+        ],
+    )
+    def test_work_item_not_exists(self, method, kwargs):
+        """Test that operating on a work item that doesn't exist raises exception."""
+        # some of these methods change the board, so each case gets its own
         board = create_sample_board()
-        non_existent_id = uuid.uuid4()
+        with pytest.raises(WorkItemNotFoundError) as excinfo:
+            getattr(board, method)(_MISSING_ID, **kwargs)
+        assert "not found on board" in str(excinfo.value)
+
+    @pytest.mark.parametrize(
+        "updates",
+        [
+            {"title": "New Title"},
+            {"description": "New description"},
+            {"status": IN_PROGRESS},
+            {"title": "New Title", "description": "New description", "status": DONE},
+        ],
+        ids=["title", "description", "status", "multiple_fields"],
+    )
+    def test_update_work_item(self, updates, board_with_task):
+        """Test updating a work item's fields."""
+        board, item = board_with_task
+        updated = board.update_work_item(item.id, **updates)
+        assert updated is item
+        for field, value in updates.items():
+            assert getattr(updated, field) == value
+            assert getattr(board.work_items[item.id], field) == value
+
+    @pytest.mark.parametrize(
+        "updates",
+        [
+            {"title": ""},
+            {"description": ""},
+            {"title": "New Title", "description": "x" * (MAX_DESCRIPTION_LENGTH + 1)},
+        ],
+        ids=["empty_title", "empty_description", "description_too_long"],
+    )
+    def test_update_work_item_validates_text_fields(self, updates, board_with_task):
+        """Test that invalid titles and descriptions are rejected without changing the item."""
+        board, item = board_with_task
         
-        with pytest.raises(WorkItemNotFoundError):
-            board.update_work_item(non_existent_id, title="New Title")
+        with pytest.raises(ValidationError):
+            board.update_work_item(item.id, **updates)
+        assert item.title == "Old Title"
+        assert item.description == "Old description"
 
-    def test_delete_work_item(self):
-        """Test deleting a work item."""
+    def test_update_work_item_marks_fields_as_set(self):
+        """Test that fields written in place are included in an exclude_unset dump."""
         board = create_sample_board()
-        item = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Test Task",
-            description="Test"
-        )
-        board.add_work_item(item)
+        item = board.add_work_item(create_sample_work_item())
+        assert "status" not in item.model_dump(exclude_unset=True)
         
+        board.update_work_item(item.id, status=DONE)
+        assert item.model_dump(exclude_unset=True)["status"] == DONE
+
+    def test_update_work_item_status_coerces_value(self, board_with_task):
+        """Test that a status given by value is stored as its enum member."""
+        board, item = board_with_task
+        updated = board.update_work_item(item.id, status="done")
+        assert updated.status is DONE
+
+    def test_delete_work_item(self, board_with_task):
+        """Test deleting a work item."""
+        board, item = board_with_task
         assert item.id in board.work_items
         board.delete_work_item(item.id)
         assert item.id not in board.work_items
@@ -325,14 +580,14 @@ class TestWorkItemCRUD:
         board = create_sample_board()
         
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent",
             description="Parent"
         )
         board.add_work_item(parent)
         
         child = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child",
             description="Child",
             parent_id=parent.id
@@ -349,14 +604,14 @@ class TestWorkItemCRUD:
         board = create_sample_board()
         
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent",
             description="Parent"
         )
         board.add_work_item(parent)
         
         child1 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child 1",
             description="Child 1",
             parent_id=parent.id
@@ -364,7 +619,7 @@ class TestWorkItemCRUD:
         board.add_work_item(child1)
         
         child2 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child 2",
             description="Child 2",
             parent_id=parent.id
@@ -382,23 +637,14 @@ class TestWorkItemCRUD:
         assert board.work_items[child1.id].parent_id is None
         assert board.work_items[child2.id].parent_id is None
 
-    def test_delete_work_item_not_exists(self):
-        """Test deleting a work item that doesn't exist raises exception."""
-        board = create_sample_board()
-        non_existent_id = uuid.uuid4()
-        
-        with pytest.raises(WorkItemNotFoundError):
-            board.delete_work_item(non_existent_id)
-
 
 # ==================== Query Methods Tests ====================
 
 class TestWorkItemQueries:
-    def test_list_work_items_empty(self):
+    def test_list_work_items_empty(self, empty_board):
         """Test listing work items when board is empty."""
-        board = create_sample_board()
-        items = board.list_work_items()
-        assert items == []
+        items = empty_board.list_work_items()
+        assert items == ()
         assert len(items) == 0
 
     def test_list_work_items_multiple(self):
@@ -406,21 +652,21 @@ class TestWorkItemQueries:
         board = create_sample_board()
         
         item1 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Task 1",
             description="Task 1"
         )
         board.add_work_item(item1)
         
         item2 = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Story 1",
             description="Story 1"
         )
         board.add_work_item(item2)
         
         item3 = create_sample_work_item(
-            work_item_type=WorkItemType.FEATURE,
+            work_item_type=FEATURE,
             title="Feature 1",
             description="Feature 1"
         )
@@ -428,52 +674,70 @@ class TestWorkItemQueries:
         
         items = board.list_work_items()
         assert len(items) == 3
-        item_ids = {item.id for item in items}
-        assert item_ids == {item1.id, item2.id, item3.id}
+        # items come back in the order they were added
+        assert [item.id for item in items] == [item1.id, item2.id, item3.id]
+
+    def test_list_work_items_is_cached_until_board_changes(self):
+        """Test that list_work_items reuses its result until the board is modified."""
+        board = create_sample_board()
+        
+        item = create_sample_work_item(
+            work_item_type=TASK,
+            title="Task",
+            description="Task"
+        )
+        board.add_work_item(item)
+        revision = board.revision
+        
+        items = board.list_work_items()
+        assert board.list_work_items() is items
+        
+        # in-place updates keep the same items, so the listing stays valid
+        board.update_work_item(item.id, title="Renamed")
+        assert board.list_work_items() is items
+        
+        updated = board.update_work_item(item.id, parent_id=None)
+        assert board.revision > revision
+        assert board.list_work_items() == (updated,)
+        
+        board.delete_work_item(item.id)
+        assert board.list_work_items() == ()
 
     def test_list_by_type(self):
         """Test listing work items by type."""
         board = create_sample_board()
         
         task1 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Task 1",
             description="Task 1"
         )
         board.add_work_item(task1)
         
         task2 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Task 2",
             description="Task 2"
         )
         board.add_work_item(task2)
         
         story = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Story 1",
             description="Story 1"
         )
         board.add_work_item(story)
         
-        tasks = board.list_by_type(WorkItemType.TASK)
+        tasks = board.list_by_type(TASK)
         assert len(tasks) == 2
-        task_ids = {task.id for task in tasks}
-        assert task_ids == {task1.id, task2.id}
+        task_ids = [task.id for task in tasks]
+        assert task_ids == [task1.id, task2.id]
         assert story.id not in task_ids
 
-    def test_list_by_type_empty(self):
+    def test_list_by_type_empty(self, ro_board_with_task):
         """Test listing by type when no items of that type exist."""
-        board = create_sample_board()
-        
-        item = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Task",
-            description="Task"
-        )
-        board.add_work_item(item)
-        
-        features = board.list_by_type(WorkItemType.FEATURE)
+        board, _ = ro_board_with_task
+        features = board.list_by_type(FEATURE)
         assert features == []
 
     def test_list_by_status(self):
@@ -481,43 +745,135 @@ class TestWorkItemQueries:
         board = create_sample_board()
         
         todo1 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Todo 1",
             description="Todo 1"
         )
         board.add_work_item(todo1)
         
         todo2 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Todo 2",
             description="Todo 2"
         )
         board.add_work_item(todo2)
         
         # Update one to in_progress
-        board.update_work_item(todo2.id, status=WorkItemStatus.IN_PROGRESS)
+        board.update_work_item(todo2.id, status=IN_PROGRESS)
         
-        todo_items = board.list_by_status(WorkItemStatus.TO_DO)
+        todo_items = board.list_by_status(TODO)
         assert len(todo_items) == 1
         assert todo_items[0].id == todo1.id
         
-        in_progress_items = board.list_by_status(WorkItemStatus.IN_PROGRESS)
+        in_progress_items = board.list_by_status(IN_PROGRESS)
         assert len(in_progress_items) == 1
         assert in_progress_items[0].id == todo2.id
 
-    def test_list_by_status_empty(self):
+    def test_list_by_status_empty(self, ro_board_with_task):
         """Test listing by status when no items have that status."""
+        board, _ = ro_board_with_task
+        done_items = board.list_by_status(DONE)
+        assert done_items == []
+
+    def test_list_by_status_follows_item_transitions(self):
+        """Test that status changes made on a board's item are reflected in queries."""
         board = create_sample_board()
         
         item = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Task",
             description="Task"
         )
         board.add_work_item(item)
         
-        done_items = board.list_by_status(WorkItemStatus.DONE)
-        assert done_items == []
+        board.get_work_item(item.id).start()
+        assert board.list_by_status(TODO) == []
+        assert board.list_by_status(IN_PROGRESS) == [item]
+        
+        board.get_work_item(item.id).complete()
+        assert board.list_by_status(IN_PROGRESS) == []
+        assert board.list_by_status(DONE) == [item]
+
+    def test_list_by_status_follows_status_assignment(self, board_with_task):
+        """Test that assigning a board item's status directly is reflected in queries."""
+        board, item = board_with_task
+        
+        item.status = DONE
+        assert board.list_by_status(TODO) == []
+        assert board.list_by_status(DONE) == [item]
+
+    def test_item_on_two_boards_keeps_both_in_sync(self):
+        """Test that an item shared by two boards updates both status indexes."""
+        first = create_sample_board()
+        second = create_sample_board()
+        item = create_sample_work_item()
+        first.add_work_item(item)
+        second.add_work_item(item)
+        
+        item.complete()
+        assert first.list_by_status(DONE) == [item]
+        assert second.list_by_status(DONE) == [item]
+        
+        # deleting it from one board leaves the other still following it
+        first.delete_work_item(item.id)
+        item.reset()
+        assert first.list_by_status(TODO) == []
+        assert second.list_by_status(TODO) == [item]
+        assert second.list_by_status(DONE) == []
+
+    def test_update_status(self):
+        """Test changing a work item's status through the board."""
+        board = create_sample_board()
+        
+        item = create_sample_work_item(
+            work_item_type=TASK,
+            title="Task",
+            description="Task"
+        )
+        board.add_work_item(item)
+        
+        updated = board.update_status(item.id, DONE)
+        assert updated is item
+        assert item.status == DONE
+        assert board.list_by_status(DONE) == [item]
+        assert board.list_by_status(TODO) == []
+
+    def test_list_queries_after_update_and_delete(self):
+        """Test that type and status queries stay consistent after updates and deletes."""
+        board = create_sample_board()
+        
+        item = create_sample_work_item(
+            work_item_type=TASK,
+            title="Task",
+            description="Task"
+        )
+        board.add_work_item(item)
+        
+        board.update_work_item(item.id, title="Renamed", status=IN_PROGRESS)
+        assert board.list_by_type(TASK) == [item]
+        assert board.list_by_status(IN_PROGRESS) == [item]
+        
+        # updating a non-scalar field replaces the stored item with a copy
+        updated = board.update_work_item(item.id, parent_id=None, status=DONE)
+        assert updated is not item
+        assert board.list_by_status(DONE) == [updated]
+        
+        # the replaced copy no longer drives the board's status index
+        item.reset()
+        assert board.list_by_status(TODO) == []
+        
+        board.delete_work_item(item.id)
+        assert board.list_by_type(TASK) == []
+        assert board.list_by_status(DONE) == []
+
+    def test_list_by_type_after_type_update(self, board_with_task):
+        """Test that changing a work item's type through update_work_item moves it in type queries."""
+        board, item = board_with_task
+        
+        updated = board.update_work_item(item.id, work_item_type=STORY)
+        assert board.list_by_type(TASK) == []
+        assert board.list_by_type(STORY) == [updated]
+        assert board.list_by_status(TODO) == [updated]
 
 
 # ==================== Relationship Methods Tests ====================
@@ -528,14 +884,14 @@ class TestWorkItemRelationships:
         board = create_sample_board()
         
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent",
             description="Parent"
         )
         board.add_work_item(parent)
         
         child = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child",
             description="Child"
         )
@@ -551,137 +907,134 @@ class TestWorkItemRelationships:
         board = create_sample_board()
         
         child = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child",
             description="Child"
         )
         board.add_work_item(child)
         
-        non_existent_parent_id = uuid.uuid4()
-        
         with pytest.raises(WorkItemNotFoundError):
-            board.link_parent_and_child(non_existent_parent_id, child.id)
+            board.link_parent_and_child(_MISSING_ID, child.id)
 
     def test_link_parent_and_child_child_not_exists(self):
         """Test linking when child doesn't exist raises exception."""
         board = create_sample_board()
         
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent",
             description="Parent"
         )
         board.add_work_item(parent)
         
-        non_existent_child_id = uuid.uuid4()
-        
         with pytest.raises(WorkItemNotFoundError):
-            board.link_parent_and_child(parent.id, non_existent_child_id)
+            board.link_parent_and_child(parent.id, _MISSING_ID)
 
-    def test_link_parent_and_child_max_children_limit(self):
-        """Test that linking respects the maximum children count limit."""
+    @pytest.mark.parametrize("via", ["link_parent_and_child", "link_children", "children_ids"])
+    def test_children_max_limit(self, via):
+        """Test that a parent can hold MAX_CHILDREN_COUNT children but no more."""
         board = create_sample_board()
         
-        parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
-            title="Parent",
-            description="Parent"
-        )
-        board.add_work_item(parent)
+        # Attach exactly MAX_CHILDREN_COUNT children - should work
+        children = _copy_child_templates(MAX_CHILDREN_COUNT)
+        board.add_many(children)
         
-        # Add exactly MAX_CHILDREN_COUNT children - should work
-        children = []
-        for i in range(MAX_CHILDREN_COUNT):
-            child = create_sample_work_item(
-                work_item_type=WorkItemType.TASK,
-                title=f"Child {i}",
-                description=f"Child {i} description"
+        if via == "children_ids":
+            parent = create_sample_work_item(
+                work_item_type=STORY,
+                title="Parent",
+                description="Parent",
+                children_ids=_CHILD_IDS[:MAX_CHILDREN_COUNT]
+            )
+            board.add_work_item(parent)
+        else:
+            parent = create_sample_work_item(
+                work_item_type=STORY,
+                title="Parent",
+                description="Parent"
             )
-            board.add_work_item(child)
-            board.link_parent_and_child(parent.id, child.id)
-            children.append(child)
+            board.add_work_item(parent)
+            if via == "link_children":
+                board.link_children(parent.id, _CHILD_IDS[:MAX_CHILDREN_COUNT])
+            else:
+                for child in children:
+                    board.link_parent_and_child(parent.id, child.id)
         
         assert len(parent.children_ids) == MAX_CHILDREN_COUNT
-        assert len(board.get_children(parent.id)) == MAX_CHILDREN_COUNT
+        work_items = board.work_items
+        assert all(child_id in work_items for child_id in parent.children_ids)
         
         # Try to add one more child - should raise ValueError
         extra_child = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Extra Child",
             description="This should fail"
         )
         board.add_work_item(extra_child)
         
-        with pytest.raises(ValueError, match=f"must not exceed {MAX_CHILDREN_COUNT}"):
+        with pytest.raises(ValueError, match=_MAX_CHILDREN_RE):
             board.link_parent_and_child(parent.id, extra_child.id)
         
         # Verify the extra child was not added
         assert len(parent.children_ids) == MAX_CHILDREN_COUNT
         assert extra_child.id not in parent.children_ids
+        assert extra_child.parent_id is None
 
-    def test_add_work_item_with_children_max_limit(self):
-        """Test that adding a work item with children_ids respects the maximum limit."""
+    def test_link_children_over_limit_links_nothing(self):
+        """Test that a batch that would exceed the children limit links none of its children."""
         board = create_sample_board()
         
-        # Create exactly MAX_CHILDREN_COUNT children
-        children = []
-        for i in range(MAX_CHILDREN_COUNT):
-            child = create_sample_work_item(
-                work_item_type=WorkItemType.TASK,
-                title=f"Child {i}",
-                description=f"Child {i} description"
-            )
-            board.add_work_item(child)
-            children.append(child)
-        
-        # Create parent with all children - should work
-        children_ids = [child.id for child in children]
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent",
-            description="Parent",
-            children_ids=children_ids
+            description="Parent"
         )
-        board.add_work_item(parent)
+        children = _copy_child_templates(MAX_CHILDREN_COUNT + 1)
+        board.add_many([parent, *children])
         
-        assert len(parent.children_ids) == MAX_CHILDREN_COUNT
+        with pytest.raises(ValueError, match=_MAX_CHILDREN_RE):
+            board.link_children(parent.id, _CHILD_IDS)
         
-        # Try to add one more child after creation - should fail
-        extra_child = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Extra Child",
-            description="This should fail"
+        assert parent.children_ids == []
+        assert all(child.parent_id is None for child in children)
+
+    def test_link_children_child_not_exists(self):
+        """Test that linking a batch with a missing child raises before linking any of them."""
+        board = create_sample_board()
+        
+        parent = create_sample_work_item(
+            work_item_type=STORY,
+            title="Parent",
+            description="Parent"
         )
-        board.add_work_item(extra_child)
+        child = create_sample_work_item(
+            work_item_type=TASK,
+            title="Child",
+            description="Child"
+        )
+        board.add_many([parent, child])
         
-        with pytest.raises(ValueError, match=f"must not exceed {MAX_CHILDREN_COUNT}"):
-            board.link_parent_and_child(parent.id, extra_child.id)
+        with pytest.raises(WorkItemNotFoundError):
+            board.link_children(parent.id, [child.id, _MISSING_ID])
+        
+        assert parent.children_ids == []
+        assert child.parent_id is None
 
     def test_add_work_item_with_too_many_children_fails(self):
         """Test that adding a work item with more than MAX_CHILDREN_COUNT children_ids fails validation."""
         board = create_sample_board()
         
         # Create MAX_CHILDREN_COUNT + 1 children
-        children = []
-        for i in range(MAX_CHILDREN_COUNT + 1):
-            child = create_sample_work_item(
-                work_item_type=WorkItemType.TASK,
-                title=f"Child {i}",
-                description=f"Child {i} description"
-            )
-            board.add_work_item(child)
-            children.append(child)
+        board.add_many(_copy_child_templates(MAX_CHILDREN_COUNT + 1))
         
         # Try to create parent with too many children - should fail at WorkItem creation
-        children_ids = [child.id for child in children]
-        
         # This should fail because WorkItem has max_length=MAX_CHILDREN_COUNT on children_ids
         with pytest.raises(ValidationError):
             parent = create_sample_work_item(
-                work_item_type=WorkItemType.STORY,
+                work_item_type=STORY,
                 title="Parent",
                 description="Parent",
-                children_ids=children_ids
+                children_ids=_CHILD_IDS
             )
             board.add_work_item(parent)
 
@@ -690,14 +1043,14 @@ class TestWorkItemRelationships:
         board = create_sample_board()
         
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent",
             description="Parent"
         )
         board.add_work_item(parent)
         
         child = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child",
             description="Child",
             parent_id=parent.id
@@ -717,36 +1070,37 @@ class TestWorkItemRelationships:
         board = create_sample_board()
         
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent",
             description="Parent"
         )
         board.add_work_item(parent)
         
         child = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child",
             description="Child"
         )
         board.add_work_item(child)
         
         # Child is not a child of parent
-        with pytest.raises(ValueError, match="is not a child"):
+        with pytest.raises(ValueError) as excinfo:
             board.unlink_parent_and_child(parent.id, child.id)
+        assert "is not a child" in str(excinfo.value)
 
     def test_get_children(self):
         """Test getting all children of a parent."""
         board = create_sample_board()
         
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent",
             description="Parent"
         )
         board.add_work_item(parent)
         
         child1 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child 1",
             description="Child 1",
             parent_id=parent.id
@@ -754,7 +1108,7 @@ class TestWorkItemRelationships:
         board.add_work_item(child1)
         
         child2 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child 2",
             description="Child 2",
             parent_id=parent.id
@@ -763,44 +1117,94 @@ class TestWorkItemRelationships:
         
         children = board.get_children(parent.id)
         assert len(children) == 2
-        child_ids = {child.id for child in children}
-        assert child_ids == {child1.id, child2.id}
+        # children come back in the order they were linked
+        assert [child.id for child in children] == [child1.id, child2.id]
 
-    def test_get_children_empty(self):
+    def test_get_children_empty(self, ro_board_with_task):
         """Test getting children when parent has no children."""
+        board, parent = ro_board_with_task
+        children = board.get_children(parent.id)
+        assert children == []
+
+    @pytest.mark.parametrize("method", ["get_children", "iter_descendants"])
+    def test_dangling_child_id_raises_not_found(self, method, board_with_task):
+        """Test that a child id missing from the board raises WorkItemNotFoundError."""
+        board, parent = board_with_task
+        parent.children_ids.append(_MISSING_ID)
+        
+        with pytest.raises(WorkItemNotFoundError, match="not found on board"):
+            list(getattr(board, method)(parent.id))
+
+    def test_iter_descendants(self):
+        """Test walking all descendants of a work item breadth first."""
         board = create_sample_board()
         
-        parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
-            title="Parent",
-            description="Parent"
+        epic = create_sample_work_item(
+            work_item_type=EPIC,
+            title="Epic",
+            description="Epic"
         )
-        board.add_work_item(parent)
+        board.add_work_item(epic)
         
-        children = board.get_children(parent.id)
-        assert children == []
+        feature = create_sample_work_item(
+            work_item_type=FEATURE,
+            title="Feature",
+            description="Feature",
+            parent_id=epic.id
+        )
+        board.add_work_item(feature)
+        
+        story = create_sample_work_item(
+            work_item_type=STORY,
+            title="Story",
+            description="Story",
+            parent_id=epic.id
+        )
+        board.add_work_item(story)
+        
+        task = create_sample_work_item(
+            work_item_type=TASK,
+            title="Task",
+            description="Task",
+            parent_id=feature.id
+        )
+        board.add_work_item(task)
+        
+        assert list(board.iter_descendants(epic.id)) == [feature, story, task]
+        assert list(board.iter_descendants(feature.id)) == [task]
+        assert list(board.iter_descendants(task.id)) == []
 
-    def test_get_children_parent_not_exists(self):
-        """Test getting children when parent doesn't exist raises exception."""
+    def test_iter_descendants_stops_on_cycles(self):
+        """Test that a cycle in the hierarchy does not loop forever."""
         board = create_sample_board()
-        non_existent_id = uuid.uuid4()
         
+        first = create_sample_work_item(title="First", description="First")
+        board.add_work_item(first)
+        
+        second = create_sample_work_item(title="Second", description="Second", parent_id=first.id)
+        board.add_work_item(second)
+        second.add_child(first.id)
+        
+        assert list(board.iter_descendants(first.id)) == [second]
+
+    def test_iter_descendants_root_not_exists(self, empty_board):
+        """Test walking descendants of a missing work item raises exception."""
         with pytest.raises(WorkItemNotFoundError):
-            board.get_children(non_existent_id)
+            next(empty_board.iter_descendants(_MISSING_ID))
 
     def test_get_parent(self):
         """Test getting the parent of a child."""
         board = create_sample_board()
         
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent",
             description="Parent"
         )
         board.add_work_item(parent)
         
         child = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child",
             description="Child",
             parent_id=parent.id
@@ -811,56 +1215,84 @@ class TestWorkItemRelationships:
         assert found_parent is not None
         assert found_parent.id == parent.id
 
-    def test_get_parent_no_parent(self):
+    def test_get_parent_no_parent(self, ro_board_with_task):
         """Test getting parent when child has no parent."""
-        board = create_sample_board()
-        
-        child = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
-            title="Child",
-            description="Child"
-        )
-        board.add_work_item(child)
-        
+        board, child = ro_board_with_task
         found_parent = board.get_parent(child.id)
         assert found_parent is None
 
-    def test_get_parent_child_not_exists(self):
-        """Test getting parent when child doesn't exist raises exception."""
-        board = create_sample_board()
-        non_existent_id = uuid.uuid4()
-        
-        with pytest.raises(WorkItemNotFoundError):
-            board.get_parent(non_existent_id)
-
 
 # ==================== Validation Tests ====================
 
 class TestWorkBoardValidation:
-    def test_max_work_items_validation(self):
+    def test_max_work_items_validation(self, monkeypatch):
         """Test that board validates maximum work items count."""
+        # Exercise the boundary on a small limit rather than the real constant
+        limit = 5
+        monkeypatch.setattr("src.models.workboard.MAX_WORK_ITEMS_COUNT", limit)
         board = create_sample_board()
         
-        # Create maximum number of items
-        for i in range(MAX_WORK_ITEMS_COUNT):
-            item = create_sample_work_item(
-                work_item_type=WorkItemType.TASK,
-                title=f"Task {i}",
-                description=f"Task {i} description"
+        # Fill the board to the maximum in one batch
+        board.add_many([
+            create_sample_work_item(
+                id=item_id,
+                work_item_type=TASK,
+                title="Task",
+                description="Task description"
             )
-            board.add_work_item(item)
+            for item_id in _uuid_pool(limit)
+        ])
         
         # This should work
-        assert len(board.work_items) == MAX_WORK_ITEMS_COUNT
+        assert len(board.work_items) == limit
         
         # Creating one more should fail validation
-        with pytest.raises(ValueError, match="must be less than"):
+        with pytest.raises(ValueError, match=_MAX_ITEMS_RE):
             extra_item = create_sample_work_item(
-                work_item_type=WorkItemType.TASK,
+                work_item_type=TASK,
                 title="One too many",
                 description="This should fail"
             )
             board.add_work_item(extra_item)
+        assert len(board.work_items) == limit
+
+
+# ==================== Serialization Tests ====================
+
+class TestWorkBoardSerialization:
+    def test_dump_json_matches_model_dump_json(self):
+        """Test that dump_json produces the same document as model_dump_json."""
+        board = create_sample_board()
+        
+        parent = create_sample_work_item(
+            work_item_type=STORY,
+            title="Parent",
+            description="Parent"
+        )
+        board.add_work_item(parent)
+        
+        child = create_sample_work_item(
+            work_item_type=TASK,
+            title="Child",
+            description="Child",
+            parent_id=parent.id,
+            status=DONE
+        )
+        board.add_work_item(child)
+        
+        assert json.loads(board.dump_json()) == json.loads(board.model_dump_json())
+
+    def test_pickled_board_follows_item_transitions(self, board_with_task):
+        """Test that items of an unpickled board still keep its status index in sync."""
+        board, item = board_with_task
+        
+        restored = pickle.loads(pickle.dumps(board))
+        restored_item = restored.get_work_item(item.id)
+        
+        restored_item.complete()
+        assert restored.list_by_status(TODO) == []
+        assert restored.list_by_status(DONE) == [restored_item]
+        assert board.list_by_status(TODO) == [item]
 
 
 # ==================== Integration Tests ====================
@@ -872,7 +1304,7 @@ class TestWorkBoardIntegration:
         
         # Create epic
         epic = create_sample_work_item(
-            work_item_type=WorkItemType.EPIC,
+            work_item_type=EPIC,
             title="User Authentication Epic",
             description="Epic for user authentication"
         )
@@ -880,7 +1312,7 @@ class TestWorkBoardIntegration:
         
         # Create feature under epic
         feature = create_sample_work_item(
-            work_item_type=WorkItemType.FEATURE,
+            work_item_type=FEATURE,
             title="Login Feature",
             description="Feature for user login",
             parent_id=epic.id
@@ -889,7 +1321,7 @@ class TestWorkBoardIntegration:
         
         # Create story under feature
         story = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Email Login Story",
             description="Story for email login",
             parent_id=feature.id
@@ -898,7 +1330,7 @@ class TestWorkBoardIntegration:
         
         # Create task under story
         task = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Implement email validation",
             description="Task to implement email validation",
             parent_id=story.id
@@ -918,7 +1350,7 @@ class TestWorkBoardIntegration:
         all_items = board.list_work_items()
         assert len(all_items) == 4
         
-        tasks = board.list_by_type(WorkItemType.TASK)
+        tasks = board.list_by_type(TASK)
         assert len(tasks) == 1
         assert tasks[0].id == task.id
         
@@ -938,14 +1370,14 @@ class TestWorkBoardIntegration:
         
         # Create items
         parent = create_sample_work_item(
-            work_item_type=WorkItemType.STORY,
+            work_item_type=STORY,
             title="Parent Story",
             description="Parent"
         )
         board.add_work_item(parent)
         
         child1 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child 1",
             description="Child 1",
             parent_id=parent.id
@@ -953,7 +1385,7 @@ class TestWorkBoardIntegration:
         board.add_work_item(child1)
         
         child2 = create_sample_work_item(
-            work_item_type=WorkItemType.TASK,
+            work_item_type=TASK,
             title="Child 2",
             description="Child 2",
             parent_id=parent.id
@@ -965,8 +1397,8 @@ class TestWorkBoardIntegration:
         assert board.get_work_item(parent.id).title == "Updated Parent"
         
         # Update child status
-        board.update_work_item(child1.id, status=WorkItemStatus.IN_PROGRESS)
-        assert board.get_work_item(child1.id).status == WorkItemStatus.IN_PROGRESS
+        board.update_work_item(child1.id, status=IN_PROGRESS)
+        assert board.get_work_item(child1.id).status == IN_PROGRESS
         
         # Delete one child
         board.delete_work_item(child1.id)
@@ -1,25 +1,73 @@
+import itertools
+import re
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime
 
 import pytest
 from pydantic import ValidationError
 
-from src.models.workitem import WorkItem, WorkItemStatus, WorkItemType, MAX_CHILDREN_COUNT
+from src.models.workitem import ChildIdList, WorkItem, WorkItemStatus, WorkItemType, MAX_CHILDREN_COUNT
+
+# Error message patterns shared by the pytest.raises checks
+_UNIQUE_CHILDREN_RE = re.compile("children_ids must contain unique UUIDs")
+_MAX_CHILDREN_RE = re.compile(f"must not exceed {MAX_CHILDREN_COUNT}")
+_UUID_ERR = re.compile("uuid", re.IGNORECASE)
+_TOO_LONG_RE = re.compile(f"at most {MAX_CHILDREN_COUNT} items")
+
+# Shared by all the test ids so they never repeat within a test run
+_next_id = itertools.count(1).__next__
+
+
+def _new_id() -> uuid.UUID:
+    """Return a UUID built from the module-wide integer counter."""
+    return uuid.UUID(int=_next_id())
+
+
+# Distinct ids sliced by the children limit tests instead of generating them in loops
+_UUID_POOL = tuple(_new_id() for _ in range(MAX_CHILDREN_COUNT + 64))
+
+# Ids reused by the children uniqueness tests
+_DUP_A = _new_id()
+_DUP_B = _new_id()
+
+# Ids appended in one call by the in-place extend test
+_EXTRA = (_new_id(), _new_id())
+
+# Fixed value for the frozen created_at checks, which only need some datetime
+_SAMPLE_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# Field values shared by every sample work item, overrides are merged on top
+_DEFAULTS = {
+    "work_item_type": WorkItemType.TASK,
+    "title": "Test title",
+    "description": "Test description",
+}
 
 
 def create_sample_work_item(**overrides) -> WorkItem:
-    data = {
-        "work_item_type": WorkItemType.TASK,
-        "title": "Test title",
-        "description": "Test description",
-    }
-    data.update(overrides)
-    return WorkItem(**data)
+    return WorkItem.model_validate({**_DEFAULTS, **overrides})
+
+
+@pytest.fixture(scope="module")
+def epic_parent() -> WorkItem:
+    """Epic shared by tests that only read it as a parent."""
+    return create_sample_work_item(
+        work_item_type=WorkItemType.EPIC,
+        title="User Authentication Epic",
+    )
+
+
+@pytest.fixture(scope="module")
+def frozen_item() -> WorkItem:
+    """Work item shared by the frozen field tests, which must never change it."""
+    return create_sample_work_item()
 
 
 class TestWorkItemBasics:
     def test_creation_defaults(self):
+        before = datetime.now()
         item = create_sample_work_item()
+        after = datetime.now()
 
         assert isinstance(item.id, uuid.UUID)
         assert item.status == WorkItemStatus.TO_DO
@@ -27,9 +75,8 @@ class TestWorkItemBasics:
         assert item.title == "Test title"
         assert item.description == "Test description"
 
-        # created_at should be close to "now"
-        now = datetime.now()
-        assert now - timedelta(seconds=5) <= item.created_at <= now + timedelta(seconds=5)
+        # created_at is stamped while the item is being created
+        assert before <= item.created_at <= after
 
     def test_status_transitions(self):
         item = create_sample_work_item()
@@ -43,24 +90,20 @@ class TestWorkItemBasics:
         item.reset()
         assert item.status == WorkItemStatus.TO_DO
 
-    def test_title_and_description_validation(self):
-        with pytest.raises(ValidationError):
-            create_sample_work_item(title="")
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            ("id", _new_id()),
+            ("work_item_type", WorkItemType.EPIC),
+            ("created_at", _SAMPLE_NOW),
+        ],
+    )
+    def test_frozen_fields_cannot_be_modified(self, frozen_item, field, value):
+        original = getattr(frozen_item, field)
 
         with pytest.raises(ValidationError):
-            create_sample_work_item(description="")
-
-    def test_frozen_fields_cannot_be_modified(self):
-        item = create_sample_work_item()
-
-        with pytest.raises(ValidationError):
-            item.id = uuid.uuid4()
-
-        with pytest.raises(ValidationError):
-            item.work_item_type = WorkItemType.EPIC
-
-        with pytest.raises(ValidationError):
-            item.created_at = datetime.now()
+            setattr(frozen_item, field, value)
+        assert getattr(frozen_item, field) == original
 
     def test_str_representation(self):
         item = create_sample_work_item(
@@ -82,117 +125,87 @@ class TestWorkItemBasics:
         assert "User can create tasks" in rep
 
 
-class TestWorkItemParentAndChildrenFields:
-    def test_parent_id_defaults_to_none(self):
-        """Test that parent_id defaults to None when not specified."""
-        item = create_sample_work_item()
-        assert item.parent_id is None
-
-    def test_children_ids_defaults_to_empty_list(self):
-        """Test that children_ids defaults to an empty list when not specified."""
-        item = create_sample_work_item()
-        assert item.children_ids == []
-        assert isinstance(item.children_ids, list)
-        assert len(item.children_ids) == 0
-
-    def test_with_parent_id(self):
-        """Test creating a WorkItem with a parent_id."""
-        parent_id = uuid.uuid4()
-        item = create_sample_work_item(parent_id=parent_id)
-
-        assert item.parent_id == parent_id
-        assert isinstance(item.parent_id, uuid.UUID)
-
-    def test_with_children_ids(self):
-        """Test creating a WorkItem with children_ids."""
-        child_id_1 = uuid.uuid4()
-        child_id_2 = uuid.uuid4()
-        child_id_3 = uuid.uuid4()
-        children_ids = [child_id_1, child_id_2, child_id_3]
-
-        item = create_sample_work_item(children_ids=children_ids)
-
-        assert item.children_ids == children_ids
-        assert len(item.children_ids) == 3
-        assert child_id_1 in item.children_ids
-        assert child_id_2 in item.children_ids
-        assert child_id_3 in item.children_ids
-
-    def test_with_parent_and_children(self):
-        """Test creating a WorkItem with both parent_id and children_ids."""
-        parent_id = uuid.uuid4()
-        child_id_1 = uuid.uuid4()
-        child_id_2 = uuid.uuid4()
-        children_ids = [child_id_1, child_id_2]
-
-        item = create_sample_work_item(
-            parent_id=parent_id,
-            children_ids=children_ids,
-        )
-
-        assert item.parent_id == parent_id
-        assert item.children_ids == children_ids
-        assert len(item.children_ids) == 2
-
-    def test_parent_id_can_be_set_to_none_explicitly(self):
-        """Test that parent_id can be explicitly set to None."""
-        item = create_sample_work_item(parent_id=None)
-        assert item.parent_id is None
-
-    def test_children_ids_can_be_empty_list(self):
-        """Test that children_ids can be explicitly set to an empty list."""
-        item = create_sample_work_item(children_ids=[])
-        assert item.children_ids == []
-        assert len(item.children_ids) == 0
-
-    def test_parent_id_validation_requires_valid_uuid(self):
-        """Test that parent_id must be a valid UUID or None."""
-        # Valid UUID should work
-        parent_id = uuid.uuid4()
-        item = create_sample_work_item(parent_id=parent_id)
-        assert item.parent_id == parent_id
-
-        # None should work
-        item = create_sample_work_item(parent_id=None)
-        assert item.parent_id is None
+class TestWorkItemValidation:
+    @pytest.mark.parametrize(
+        "kwargs, pattern",
+        [
+            ({"title": ""}, None),
+            ({"description": ""}, None),
+            ({"parent_id": "not-a-uuid"}, _UUID_ERR),
+            ({"children_ids": [_UUID_POOL[0], "not-a-uuid"]}, None),
+            ({"children_ids": "not-a-list"}, None),
+            # the length limit is checked before uniqueness, so repeats of one id are enough
+            ({"children_ids": [_UUID_POOL[0]] * (MAX_CHILDREN_COUNT + 1)}, _TOO_LONG_RE),
+            ({"children_ids": [_UUID_POOL[0]] * (MAX_CHILDREN_COUNT + 50)}, _TOO_LONG_RE),
+            ({"children_ids": [_DUP_A, _DUP_A]}, _UNIQUE_CHILDREN_RE),
+            ({"children_ids": [_DUP_A, _DUP_B, _DUP_A]}, _UNIQUE_CHILDREN_RE),
+        ],
+        ids=[
+            "empty_title",
+            "empty_description",
+            "invalid_parent_id",
+            "invalid_child_id",
+            "children_not_a_list",
+            "too_many_children",
+            "way_too_many_children",
+            "duplicate_children",
+            "mixed_duplicate_children",
+        ],
+    )
+    def test_validation_errors(self, kwargs, pattern):
+        """Invalid field values should be rejected when the item is created."""
+        with pytest.raises(ValidationError, match=pattern):
+            create_sample_work_item(**kwargs)
 
-        # Invalid UUID should raise ValidationError
-        with pytest.raises(ValidationError):
-            create_sample_work_item(parent_id="not-a-uuid")
 
-    def test_children_ids_validation_requires_valid_uuids(self):
-        """Test that children_ids must contain valid UUIDs."""
-        valid_uuid_1 = uuid.uuid4()
-        valid_uuid_2 = uuid.uuid4()
+class TestWorkItemParentAndChildrenFields:
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"parent_id": None},
+            {"children_ids": []},
+            {"parent_id": _new_id()},
+            {"children_ids": [_new_id(), _new_id(), _new_id()]},
+            {"parent_id": _new_id(), "children_ids": [_new_id(), _new_id()]},
+        ],
+        ids=["defaults", "none_parent", "empty_children", "parent", "children", "parent_and_children"],
+    )
+    def test_parent_and_children_construction(self, overrides):
+        """Test creating a WorkItem with and without parent_id and children_ids."""
+        item = create_sample_work_item(**overrides)
+        expected_children = overrides.get("children_ids", [])
+
+        # a UUID only compares equal to a UUID and a list only to a list, so the
+        # equality checks also pin down the field types
+        assert item.parent_id == overrides.get("parent_id")
+        assert item.children_ids == expected_children
+        assert all(child_id in item.children_ids for child_id in expected_children)
+
+    def test_children_ids_accepts_valid_uuids(self):
+        """Test that children_ids accepts a list of valid UUIDs."""
+        valid_uuid_1 = _new_id()
+        valid_uuid_2 = _new_id()
 
         # Valid UUIDs should work
         item = create_sample_work_item(children_ids=[valid_uuid_1, valid_uuid_2])
         assert len(item.children_ids) == 2
 
-        # Invalid UUID in list should raise ValidationError
-        with pytest.raises(ValidationError):
-            create_sample_work_item(children_ids=[valid_uuid_1, "not-a-uuid"])
-
-        # Non-list should raise ValidationError
-        with pytest.raises(ValidationError):
-            create_sample_work_item(children_ids="not-a-list")
-
     def test_children_ids_can_be_modified(self):
         """Test that children_ids list can be modified (unlike frozen fields)."""
         item = create_sample_work_item()
-        assert item.children_ids == []
+        cids = item.children_ids
+        assert cids == []
 
         # Should be able to append to children_ids
-        child_id = uuid.uuid4()
-        item.children_ids.append(child_id)
-        assert len(item.children_ids) == 1
-        assert child_id in item.children_ids
+        child_id = _new_id()
+        cids.append(child_id)
+        assert len(cids) == 1
+        assert child_id in cids
 
         # Should be able to extend children_ids
-        child_id_2 = uuid.uuid4()
-        child_id_3 = uuid.uuid4()
-        item.children_ids.extend([child_id_2, child_id_3])
-        assert len(item.children_ids) == 3
+        cids.extend(_EXTRA)
+        assert len(cids) == 3
 
     def test_parent_id_can_be_modified(self):
         """Test that parent_id can be modified (unlike frozen fields)."""
@@ -200,12 +213,12 @@ class TestWorkItemParentAndChildrenFields:
         assert item.parent_id is None
 
         # Should be able to set parent_id
-        parent_id = uuid.uuid4()
+        parent_id = _new_id()
         item.parent_id = parent_id
         assert item.parent_id == parent_id
 
         # Should be able to change parent_id
-        new_parent_id = uuid.uuid4()
+        new_parent_id = _new_id()
         item.parent_id = new_parent_id
         assert item.parent_id == new_parent_id
 
@@ -213,13 +226,10 @@ class TestWorkItemParentAndChildrenFields:
         item.parent_id = None
         assert item.parent_id is None
 
-    def test_parent_child_relationship_example(self):
+    def test_parent_child_relationship_example(self, epic_parent):
         """Test a realistic parent-child relationship scenario."""
-        # Create a parent epic
-        epic = create_sample_work_item(
-            work_item_type=WorkItemType.EPIC,
-            title="User Authentication Epic",
-        )
+        # The parent epic is shared and only read
+        epic = epic_parent
 
         # Create a feature that belongs to the epic
         feature = create_sample_work_item(
@@ -248,24 +258,21 @@ class TestWorkItemParentAndChildrenFields:
         assert story_1.parent_id == feature.id
         assert story_2.parent_id == feature.id
         assert feature.children_ids == [story_1.id, story_2.id]
-        assert len(feature.children_ids) == 2
 
     def test_children_ids_preserves_order(self):
         """Test that children_ids preserves the order of UUIDs."""
-        child_id_1 = uuid.uuid4()
-        child_id_2 = uuid.uuid4()
-        child_id_3 = uuid.uuid4()
+        child_id_1 = _new_id()
+        child_id_2 = _new_id()
+        child_id_3 = _new_id()
         children_ids = [child_id_1, child_id_2, child_id_3]
 
         item = create_sample_work_item(children_ids=children_ids)
 
-        assert item.children_ids[0] == child_id_1
-        assert item.children_ids[1] == child_id_2
-        assert item.children_ids[2] == child_id_3
+        assert tuple(item.children_ids) == (child_id_1, child_id_2, child_id_3)
 
-    def test_multiple_items_with_same_parent(self):
+    def test_multiple_items_with_same_parent(self, epic_parent):
         """Test multiple WorkItems can share the same parent_id."""
-        parent_id = uuid.uuid4()
+        parent_id = epic_parent.id
 
         item_1 = create_sample_work_item(
             title="Item 1",
@@ -283,7 +290,6 @@ class TestWorkItemParentAndChildrenFields:
         assert item_1.parent_id == parent_id
         assert item_2.parent_id == parent_id
         assert item_3.parent_id == parent_id
-        assert item_1.parent_id == item_2.parent_id == item_3.parent_id
 
     def test_work_item_can_have_multiple_children(self):
         """Test that a WorkItem can have multiple children."""
@@ -305,7 +311,7 @@ class TestWorkItemParentAndChildrenFields:
             title="Child 3",
         )
 
-        parent.children_ids = [child_1.id, child_2.id, child_3.id]
+        parent.set_children([child_1.id, child_2.id, child_3.id])
 
         assert len(parent.children_ids) == 3
         assert child_1.id in parent.children_ids
@@ -314,40 +320,28 @@ class TestWorkItemParentAndChildrenFields:
 
     def test_children_ids_can_be_cleared(self):
         """Test that children_ids can be cleared."""
-        child_id_1 = uuid.uuid4()
-        child_id_2 = uuid.uuid4()
+        child_id_1 = _new_id()
+        child_id_2 = _new_id()
 
         item = create_sample_work_item(children_ids=[child_id_1, child_id_2])
-        assert len(item.children_ids) == 2
+        cids = item.children_ids
+        assert len(cids) == 2
 
-        item.children_ids.clear()
-        assert len(item.children_ids) == 0
-        assert item.children_ids == []
+        cids.clear()
+        assert cids == []
 
 
 class TestWorkItemChildrenConstraints:
-    def test_children_ids_uniqueness_enforced_on_creation(self):
-        """Test that uniqueness is enforced when creating WorkItem with duplicate children_ids."""
-        child_id_1 = uuid.uuid4()
-        child_id_2 = uuid.uuid4()
-
+    def test_children_ids_accepts_unique_ids_on_creation(self):
+        """Test that a WorkItem can be created with unique children_ids."""
         # Valid: Creating with unique IDs
-        item = create_sample_work_item(children_ids=[child_id_1, child_id_2])
+        item = create_sample_work_item(children_ids=[_DUP_A, _DUP_B])
         assert len(item.children_ids) == 2
 
-        # Invalid: Creating with duplicate IDs should raise ValueError
-        duplicate_id = uuid.uuid4()
-        with pytest.raises(ValueError, match="children_ids must contain unique UUIDs"):
-            create_sample_work_item(children_ids=[duplicate_id, duplicate_id])
-
-        # Invalid: Creating with mixed unique and duplicate IDs
-        with pytest.raises(ValueError, match="children_ids must contain unique UUIDs"):
-            create_sample_work_item(children_ids=[child_id_1, child_id_2, child_id_1])
-
     def test_children_ids_uniqueness_enforced_on_validation(self):
         """Test that uniqueness is enforced when validating a WorkItem."""
-        child_id_1 = uuid.uuid4()
-        child_id_2 = uuid.uuid4()
+        child_id_1 = _new_id()
+        child_id_2 = _new_id()
 
         # Create a valid item
         item = create_sample_work_item(children_ids=[child_id_1, child_id_2])
@@ -356,46 +350,70 @@ class TestWorkItemChildrenConstraints:
         item.children_ids.append(child_id_1)  # Adding duplicate
 
         # But validation should catch it when we re-validate
-        with pytest.raises(ValueError, match="children_ids must contain unique UUIDs"):
-            WorkItem.model_validate(item.model_dump())
+        with pytest.raises(ValueError, match=_UNIQUE_CHILDREN_RE):
+            item.revalidate()
+
+    def test_revalidate_accepts_valid_item_and_leaves_it_unchanged(self):
+        """revalidate should pass for a valid item without replacing its fields."""
+        item = create_sample_work_item(children_ids=[_new_id()])
+        children_ids = item.children_ids
 
-    def test_children_ids_max_length_limit(self):
-        """Test that children_ids cannot exceed MAX_CHILDREN_COUNT."""
+        item.revalidate()
+
+        assert item.children_ids is children_ids
+
+    def test_revalidate_catches_too_many_children(self):
+        """revalidate should enforce the children_ids length limit after in-place edits."""
+        item = create_sample_work_item()
+        item.children_ids.extend(_UUID_POOL[:MAX_CHILDREN_COUNT + 1])
+
+        with pytest.raises(ValidationError):
+            item.revalidate()
+
+    def test_children_ids_accepts_up_to_max_count(self):
+        """Test that children_ids accepts up to MAX_CHILDREN_COUNT UUIDs."""
         # Valid: Creating with exactly MAX_CHILDREN_COUNT children
-        max_children = [uuid.uuid4() for _ in range(MAX_CHILDREN_COUNT)]
+        max_children = list(_UUID_POOL[:MAX_CHILDREN_COUNT])
         item = create_sample_work_item(children_ids=max_children)
         assert len(item.children_ids) == MAX_CHILDREN_COUNT
 
         # Valid: Creating with fewer than MAX_CHILDREN_COUNT children
-        fewer_children = [uuid.uuid4() for _ in range(MAX_CHILDREN_COUNT - 1)]
+        fewer_children = list(_UUID_POOL[:MAX_CHILDREN_COUNT - 1])
         item = create_sample_work_item(children_ids=fewer_children)
         assert len(item.children_ids) == MAX_CHILDREN_COUNT - 1
 
-        # Invalid: Creating with more than MAX_CHILDREN_COUNT children should raise ValidationError
-        too_many_children = [uuid.uuid4() for _ in range(MAX_CHILDREN_COUNT + 1)]
-        with pytest.raises(ValidationError):
-            create_sample_work_item(children_ids=too_many_children)
 
-        # Invalid: Creating with significantly more than MAX_CHILDREN_COUNT
-        way_too_many = [uuid.uuid4() for _ in range(MAX_CHILDREN_COUNT + 50)]
-        with pytest.raises(ValidationError):
-            create_sample_work_item(children_ids=way_too_many)
+class TestWorkItemHelperMethods:
+    @pytest.mark.parametrize(
+        "method, args, field",
+        [
+            ("start", (), "status"),
+            ("add_parent", (_new_id(),), "parent_id"),
+            ("remove_parent", (), "parent_id"),
+            ("set_children", ([_new_id()],), "children_ids"),
+        ],
+    )
+    def test_helpers_mark_field_as_set(self, method, args, field):
+        """Helper methods should mark the field they write as set, like an assignment."""
+        item = create_sample_work_item()
 
+        getattr(item, method)(*args)
+
+        assert field in item.model_dump(exclude_unset=True)
 
-class TestWorkItemHelperMethods:
     def test_add_parent_sets_parent_id(self):
         """add_parent should set parent_id to the given UUID."""
         item = create_sample_work_item()
         assert item.parent_id is None
 
-        parent_id = uuid.uuid4()
+        parent_id = _new_id()
         item.add_parent(parent_id)
 
         assert item.parent_id == parent_id
 
     def test_remove_parent_clears_parent_id(self):
         """remove_parent should set parent_id to None."""
-        parent_id = uuid.uuid4()
+        parent_id = _new_id()
         item = create_sample_work_item(parent_id=parent_id)
         assert item.parent_id == parent_id
 
@@ -406,18 +424,19 @@ class TestWorkItemHelperMethods:
     def test_add_child_appends_child_id(self):
         """add_child should append a new child_id to children_ids."""
         item = create_sample_work_item()
-        assert item.children_ids == []
+        cids = item.children_ids
+        assert cids == []
 
-        child_id = uuid.uuid4()
+        child_id = _new_id()
         item.add_child(child_id)
 
-        assert len(item.children_ids) == 1
-        assert item.children_ids[0] == child_id
+        assert len(cids) == 1
+        assert cids[0] == child_id
 
     def test_add_child_is_idempotent_if_child_already_present(self):
         """add_child should do nothing (be idempotent) if the child is already in children_ids."""
         item = create_sample_work_item()
-        child_id = uuid.uuid4()
+        child_id = _new_id()
 
         item.add_child(child_id)
         assert child_id in item.children_ids
@@ -431,19 +450,68 @@ class TestWorkItemHelperMethods:
         item = create_sample_work_item()
 
         # Pre-fill to the max
-        for _ in range(MAX_CHILDREN_COUNT):
-            item.children_ids.append(uuid.uuid4())
+        item.children_ids.extend(_UUID_POOL[:MAX_CHILDREN_COUNT])
 
         assert len(item.children_ids) == MAX_CHILDREN_COUNT
 
         # Now adding via helper should fail
-        with pytest.raises(ValueError, match="must not exceed"):
-            item.add_child(uuid.uuid4())
+        with pytest.raises(ValueError, match=_MAX_CHILDREN_RE):
+            item.add_child(_new_id())
+
+    def test_add_children_skips_existing_and_repeated_ids(self):
+        """add_children should append each new child_id once, in order."""
+        existing_id = _new_id()
+        new_id_1 = _new_id()
+        new_id_2 = _new_id()
+        item = create_sample_work_item(children_ids=[existing_id])
+
+        item.add_children([new_id_1, existing_id, new_id_2, new_id_1])
+
+        assert item.children_ids == [existing_id, new_id_1, new_id_2]
+
+    def test_add_children_respects_max_children_count(self):
+        """add_children should reject the whole batch if it would exceed MAX_CHILDREN_COUNT."""
+        item = create_sample_work_item(children_ids=[_new_id()])
+        before = list(item.children_ids)
+
+        with pytest.raises(ValueError, match=_MAX_CHILDREN_RE):
+            item.add_children(list(_UUID_POOL[:MAX_CHILDREN_COUNT]))
+        assert item.children_ids == before
+
+    def test_set_children_replaces_children_ids(self):
+        """set_children should replace children_ids with a ChildIdList of the given ids."""
+        old_id = _new_id()
+        new_id_1 = _new_id()
+        new_id_2 = _new_id()
+        item = create_sample_work_item(children_ids=[old_id])
+
+        item.set_children([new_id_1, new_id_2])
+
+        assert type(item.children_ids) is ChildIdList
+        assert item.children_ids == [new_id_1, new_id_2]
+        assert old_id not in item.children_ids
+
+    @pytest.mark.parametrize(
+        "child_ids, pattern",
+        [
+            (list(_UUID_POOL[:2]) + [_UUID_POOL[0]], _UNIQUE_CHILDREN_RE),
+            (list(_UUID_POOL[:MAX_CHILDREN_COUNT + 1]), _MAX_CHILDREN_RE),
+        ],
+        ids=["duplicates", "too_many"],
+    )
+    def test_set_children_rejects_invalid_ids(self, child_ids, pattern):
+        """set_children should leave children_ids untouched when the new ids are invalid."""
+        item = create_sample_work_item(children_ids=[_new_id()])
+        before = list(item.children_ids)
+
+        with pytest.raises(ValueError, match=pattern):
+            item.set_children(child_ids)
+        assert item.children_ids == before
 
     def test_remove_child_removes_existing_child(self):
         """remove_child should remove the given child_id from children_ids."""
-        child_id_1 = uuid.uuid4()
-        child_id_2 = uuid.uuid4()
+        child_id_1 = _new_id()
+        child_id_2 = _new_id()
         item = create_sample_work_item(children_ids=[child_id_1, child_id_2])
 
         item.remove_child(child_id_1)
@@ -453,11 +521,85 @@ class TestWorkItemHelperMethods:
 
     def test_remove_child_raises_if_child_not_present(self):
         """remove_child should raise if the given child_id is not in children_ids."""
-        child_id = uuid.uuid4()
+        child_id = _new_id()
         item = create_sample_work_item()
         assert child_id not in item.children_ids
 
-        with pytest.raises(ValueError, match="not a child"):
+        with pytest.raises(ValueError) as excinfo:
             item.remove_child(child_id)
+        assert "not a child" in str(excinfo.value)
+
+
+class TestChildIdList:
+    def test_children_ids_is_backed_by_child_id_list(self):
+        """children_ids should be a ChildIdList however the item was built."""
+        item = create_sample_work_item(children_ids=[_new_id()])
+        assert isinstance(item.children_ids, ChildIdList)
+
+        constructed = WorkItem.model_construct(
+            work_item_type=WorkItemType.TASK,
+            title="Test title",
+            description="Test description",
+        )
+        assert isinstance(constructed.children_ids, ChildIdList)
+
+    def test_assigned_children_ids_is_wrapped_in_child_id_list(self):
+        """Assigning a plain list to children_ids should keep it a ChildIdList."""
+        child_id = _new_id()
+        item = create_sample_work_item()
+
+        item.children_ids = [child_id]
+
+        assert type(item.children_ids) is ChildIdList
+        assert child_id in item.children_ids
+        assert "children_ids" in item.model_fields_set
+
+    def test_model_construct_skips_uniqueness_check(self):
+        """model_construct should not validate, so duplicate children_ids are kept as given."""
+        child_id = _new_id()
+        constructed = WorkItem.model_construct(children_ids=[child_id, child_id], **_DEFAULTS)
 
+        assert constructed.children_ids == [child_id, child_id]
+        assert constructed.children_ids.has_duplicates()
 
+    def test_membership_follows_list_mutations(self):
+        """Membership checks should stay in sync with in-place list mutations."""
+        child_id_1 = _new_id()
+        child_id_2 = _new_id()
+        item = create_sample_work_item()
+        cids = item.children_ids
+
+        cids.append(child_id_1)
+        cids.extend([child_id_2])
+        assert child_id_1 in cids
+        assert child_id_2 in cids
+
+        cids.pop()
+        assert child_id_2 not in cids
+
+        cids.clear()
+        assert child_id_1 not in cids
+
+    def test_membership_survives_removing_a_duplicate(self):
+        """Removing one copy of a duplicated id should keep the other copy visible."""
+        child_id = _new_id()
+        item = create_sample_work_item(children_ids=[child_id])
+        cids = item.children_ids
+
+        cids.append(child_id)
+        cids.remove(child_id)
+        assert child_id in cids
+
+        cids.remove(child_id)
+        assert child_id not in cids
+
+    def test_model_copy_rebuilds_replaced_children_ids(self):
+        """model_copy should wrap a replacement children_ids in a fresh ChildIdList."""
+        child_id = _new_id()
+        item = create_sample_work_item()
+
+        copied = item.model_copy(update={"children_ids": [child_id]})
+
+        assert isinstance(copied.children_ids, ChildIdList)
+        assert child_id in copied.children_ids
+        assert child_id not in item.children_ids